@@ -6,7 +6,7 @@ from alembic import context
 
 from app.config import settings
 from app.database.base import Base
-from app.models import User, Task, Comment  # noqa: F401
+from app.models import User, Task, Comment, TaskTombstone  # noqa: F401
 
 config = context.config
 config.set_main_option("sqlalchemy.url", settings.DATABASE_URL)
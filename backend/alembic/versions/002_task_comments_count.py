@@ -0,0 +1,36 @@
+"""task comments_count
+
+Revision ID: 002
+Revises: 001
+Create Date: 2024-02-01 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '002'
+down_revision: Union[str, None] = '001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'tasks',
+        sa.Column('comments_count', sa.Integer, nullable=False, server_default='0'),
+    )
+
+    # Backfill from existing comments
+    op.execute(
+        """
+        UPDATE tasks SET comments_count = c.cnt
+        FROM (SELECT task_id, count(*) AS cnt FROM comments GROUP BY task_id) AS c
+        WHERE tasks.id = c.task_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('tasks', 'comments_count')
@@ -0,0 +1,47 @@
+"""task list and comment indexes
+
+Revision ID: 004
+Revises: 003
+Create Date: 2024-03-01 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '004'
+down_revision: Union[str, None] = '003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (name, table, columns, partial WHERE clause)
+INDEXES = [
+    # Admin list: ORDER BY created_at, id (either direction, incl. keyset pages)
+    ('ix_tasks_created_at_id', 'tasks', ['created_at', 'id'], None),
+    # Developer-scoped list and the assigned_to filter
+    ('ix_tasks_assigned_to_created_at', 'tasks', ['assigned_to', 'created_at', 'id'], None),
+    ('ix_tasks_status_created_at', 'tasks', ['status', 'created_at', 'id'], None),
+    ('ix_tasks_priority_created_at', 'tasks', ['priority', 'created_at', 'id'], None),
+    # Overdue scan only ever looks at open tasks with a deadline
+    ('ix_tasks_open_deadline', 'tasks', ['deadline', 'id'],
+     "status <> 'done' AND deadline IS NOT NULL"),
+    ('ix_comments_task_id_created_at', 'comments', ['task_id', 'created_at'], None),
+]
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in INDEXES:
+            op.create_index(
+                name, table, columns,
+                postgresql_concurrently=True,
+                postgresql_where=sa.text(where) if where else None,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
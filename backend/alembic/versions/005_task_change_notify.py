@@ -0,0 +1,94 @@
+"""task and comment change notifications
+
+Revision ID: 005
+Revises: 004
+Create Date: 2024-03-15 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '005'
+down_revision: Union[str, None] = '004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Must match app.core.events.CHANNEL
+CHANNEL = 'task_changes'
+
+
+def upgrade() -> None:
+    # NOTIFY is transactional: listeners only see the event once the write
+    # commits, and never for a rolled back one. Bulk loaders can switch it off
+    # with SET LOCAL app.skip_notify = 'on'.
+    op.execute(f"""
+        CREATE FUNCTION notify_task_change() RETURNS trigger AS $$
+        DECLARE
+            task_row tasks%ROWTYPE;
+        BEGIN
+            IF current_setting('app.skip_notify', true) = 'on' THEN
+                RETURN NULL;
+            END IF;
+            task_row := CASE WHEN TG_OP = 'DELETE' THEN OLD ELSE NEW END;
+            PERFORM pg_notify('{CHANNEL}', json_build_object(
+                'entity', 'task',
+                'op', lower(TG_OP),
+                'id', task_row.id,
+                'assigned_to', task_row.assigned_to,
+                'previous_assigned_to', CASE WHEN TG_OP = 'UPDATE' THEN OLD.assigned_to END,
+                'status', task_row.status,
+                'comments_count', task_row.comments_count,
+                'updated_at', task_row.updated_at
+            )::text);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute(f"""
+        CREATE FUNCTION notify_comment_change() RETURNS trigger AS $$
+        DECLARE
+            comment_row comments%ROWTYPE;
+            task_assignee uuid;
+        BEGIN
+            IF current_setting('app.skip_notify', true) = 'on' THEN
+                RETURN NULL;
+            END IF;
+            comment_row := CASE WHEN TG_OP = 'DELETE' THEN OLD ELSE NEW END;
+            SELECT assigned_to INTO task_assignee FROM tasks WHERE id = comment_row.task_id;
+            -- Comments removed by a task delete cascade are covered by the task event
+            IF NOT FOUND THEN
+                RETURN NULL;
+            END IF;
+            PERFORM pg_notify('{CHANNEL}', json_build_object(
+                'entity', 'comment',
+                'op', lower(TG_OP),
+                'id', comment_row.id,
+                'task_id', comment_row.task_id,
+                'assigned_to', task_assignee
+            )::text);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER tasks_notify_insert_delete AFTER INSERT OR DELETE ON tasks
+        FOR EACH ROW EXECUTE FUNCTION notify_task_change()
+    """)
+    op.execute("""
+        CREATE TRIGGER tasks_notify_update AFTER UPDATE ON tasks
+        FOR EACH ROW WHEN (OLD.* IS DISTINCT FROM NEW.*) EXECUTE FUNCTION notify_task_change()
+    """)
+    op.execute("""
+        CREATE TRIGGER comments_notify AFTER INSERT OR DELETE ON comments
+        FOR EACH ROW EXECUTE FUNCTION notify_comment_change()
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER comments_notify ON comments")
+    op.execute("DROP TRIGGER tasks_notify_update ON tasks")
+    op.execute("DROP TRIGGER tasks_notify_insert_delete ON tasks")
+    op.execute("DROP FUNCTION notify_comment_change()")
+    op.execute("DROP FUNCTION notify_task_change()")
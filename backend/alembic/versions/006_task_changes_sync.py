@@ -0,0 +1,108 @@
+"""task delta sync: tombstones and updated_at bookkeeping
+
+Revision ID: 006
+Revises: 005
+Create Date: 2024-03-22 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision: str = '006'
+down_revision: Union[str, None] = '005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (name, columns) on tasks, built without blocking writes
+TASK_INDEXES = [
+    # GET /tasks/changes: ORDER BY updated_at, id from the watermark on
+    ('ix_tasks_updated_at_id', ['updated_at', 'id']),
+    # Same for the developer-scoped feed
+    ('ix_tasks_assigned_to_updated_at', ['assigned_to', 'updated_at', 'id']),
+]
+
+
+def upgrade() -> None:
+    op.create_table(
+        'task_tombstones',
+        sa.Column('id', sa.BigInteger(), sa.Identity(), primary_key=True),
+        sa.Column('task_id', postgresql.UUID(as_uuid=True), nullable=False),
+        # Who could see the task before; developers get tombstones for tasks
+        # taken away from them as well as deleted ones
+        sa.Column('assigned_to', postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column('reason', sa.String(20), nullable=False),
+        sa.Column('deleted_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+    op.create_index('ix_task_tombstones_deleted_at', 'task_tombstones', ['deleted_at', 'task_id'])
+    op.create_index(
+        'ix_task_tombstones_assigned_to_deleted_at', 'task_tombstones',
+        ['assigned_to', 'deleted_at', 'task_id'],
+    )
+
+    op.execute("UPDATE tasks SET updated_at = created_at WHERE updated_at IS NULL")
+    op.alter_column('tasks', 'updated_at', nullable=False)
+
+    # Every change to a task row moves updated_at, whichever code path made it
+    # (status changes, comment counters, bulk updates, manual SQL)
+    op.execute("""
+        CREATE FUNCTION touch_task_updated_at() RETURNS trigger AS $$
+        BEGIN
+            IF (NEW.title, NEW.description, NEW.status, NEW.priority, NEW.assigned_to,
+                NEW.created_by, NEW.deadline, NEW.completed_at, NEW.comments_count)
+               IS DISTINCT FROM
+               (OLD.title, OLD.description, OLD.status, OLD.priority, OLD.assigned_to,
+                OLD.created_by, OLD.deadline, OLD.completed_at, OLD.comments_count) THEN
+                NEW.updated_at := now();
+            END IF;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER tasks_touch_updated_at BEFORE UPDATE ON tasks
+        FOR EACH ROW EXECUTE FUNCTION touch_task_updated_at()
+    """)
+    op.execute("""
+        CREATE FUNCTION record_task_tombstone() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'DELETE' THEN
+                INSERT INTO task_tombstones (task_id, assigned_to, reason)
+                VALUES (OLD.id, OLD.assigned_to, 'deleted');
+            ELSE
+                INSERT INTO task_tombstones (task_id, assigned_to, reason)
+                VALUES (OLD.id, OLD.assigned_to, 'unassigned');
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER tasks_tombstone_delete AFTER DELETE ON tasks
+        FOR EACH ROW EXECUTE FUNCTION record_task_tombstone()
+    """)
+    op.execute("""
+        CREATE TRIGGER tasks_tombstone_unassign AFTER UPDATE OF assigned_to ON tasks
+        FOR EACH ROW WHEN (OLD.assigned_to IS NOT NULL AND OLD.assigned_to IS DISTINCT FROM NEW.assigned_to)
+        EXECUTE FUNCTION record_task_tombstone()
+    """)
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        for name, columns in TASK_INDEXES:
+            op.create_index(name, 'tasks', columns, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _ in reversed(TASK_INDEXES):
+            op.drop_index(name, table_name='tasks', postgresql_concurrently=True)
+    op.execute("DROP TRIGGER tasks_tombstone_unassign ON tasks")
+    op.execute("DROP TRIGGER tasks_tombstone_delete ON tasks")
+    op.execute("DROP TRIGGER tasks_touch_updated_at ON tasks")
+    op.execute("DROP FUNCTION record_task_tombstone()")
+    op.execute("DROP FUNCTION touch_task_updated_at()")
+    op.alter_column('tasks', 'updated_at', nullable=True)
+    op.drop_table('task_tombstones')
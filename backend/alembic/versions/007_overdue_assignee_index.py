@@ -0,0 +1,37 @@
+"""overdue tasks per assignee index
+
+Revision ID: 007
+Revises: 006
+Create Date: 2024-03-29 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '007'
+down_revision: Union[str, None] = '006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Same predicate as ix_tasks_open_deadline (migration 004): GET /tasks/overdue
+# with assigned_to pages through it, and /overdue/by-assignee counts from it
+# with an index-only scan
+INDEX = 'ix_tasks_open_deadline_assigned_to'
+WHERE = "status <> 'done' AND deadline IS NOT NULL"
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            INDEX, 'tasks', ['assigned_to', 'deadline', 'id'],
+            postgresql_concurrently=True,
+            postgresql_where=sa.text(WHERE),
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(INDEX, table_name='tasks', postgresql_concurrently=True)
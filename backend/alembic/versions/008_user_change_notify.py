@@ -0,0 +1,46 @@
+"""user change notifications for per-worker user caches
+
+Revision ID: 008
+Revises: 007
+Create Date: 2024-04-05 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '008'
+down_revision: Union[str, None] = '007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Must match app.core.events.USER_CHANNEL
+CHANNEL = 'user_changes'
+
+
+def upgrade() -> None:
+    # Every worker drops the user from its cache once the change commits,
+    # whichever worker (or manual SQL) made it
+    op.execute(f"""
+        CREATE FUNCTION notify_user_change() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('{CHANNEL}', json_build_object('id', OLD.id)::text);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER users_notify_update AFTER UPDATE ON users
+        FOR EACH ROW WHEN (OLD.* IS DISTINCT FROM NEW.*) EXECUTE FUNCTION notify_user_change()
+    """)
+    op.execute("""
+        CREATE TRIGGER users_notify_delete AFTER DELETE ON users
+        FOR EACH ROW EXECUTE FUNCTION notify_user_change()
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER users_notify_delete ON users")
+    op.execute("DROP TRIGGER users_notify_update ON users")
+    op.execute("DROP FUNCTION notify_user_change()")
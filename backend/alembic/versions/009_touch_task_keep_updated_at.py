@@ -0,0 +1,53 @@
+"""let bulk loaders keep their own task updated_at
+
+Revision ID: 009
+Revises: 008
+Create Date: 2024-04-12 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = '009'
+down_revision: Union[str, None] = '008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CHANGED = """
+            IF (NEW.title, NEW.description, NEW.status, NEW.priority, NEW.assigned_to,
+                NEW.created_by, NEW.deadline, NEW.completed_at, NEW.comments_count)
+               IS DISTINCT FROM
+               (OLD.title, OLD.description, OLD.status, OLD.priority, OLD.assigned_to,
+                OLD.created_by, OLD.deadline, OLD.completed_at, OLD.comments_count) THEN
+                NEW.updated_at := now();
+            END IF;
+"""
+
+
+def upgrade() -> None:
+    # seed.py loads comments with SET LOCAL app.keep_updated_at = 'on' so the
+    # comments_count bump leaves its generated updated_at alone
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION touch_task_updated_at() RETURNS trigger AS $$
+        BEGIN
+            IF current_setting('app.keep_updated_at', true) = 'on' THEN
+                RETURN NEW;
+            END IF;
+            {CHANGED}
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+
+
+def downgrade() -> None:
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION touch_task_updated_at() RETURNS trigger AS $$
+        BEGIN
+            {CHANGED}
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
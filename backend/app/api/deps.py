@@ -1,5 +1,5 @@
 from uuid import UUID
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Query, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 from jose import JWTError
@@ -7,15 +7,13 @@ from jose import JWTError
 from app.database.session import get_db
 from app.core.security import decode_token
 from app.models.user import User
+from app.services import user_service
 from app.utils.enums import UserRole, UserStatus
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
 
-async def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    db: AsyncSession = Depends(get_db),
-) -> User:
+async def _user_from_token(token: str, db: AsyncSession, token_type: str = "access") -> User:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Token yaroqsiz",
@@ -23,18 +21,30 @@ async def get_current_user(
     )
     try:
         payload = decode_token(token)
-        if payload.get("type") != "access":
+        if payload.get("type") != token_type:
             raise credentials_exception
         user_id = UUID(payload["sub"])
     except (JWTError, ValueError, KeyError):
         raise credentials_exception
 
+    user = user_service.get_cached_user(user_id)
+    if user:
+        return user
+
     user = await db.get(User, user_id)
     if not user:
         raise credentials_exception
+    user_service.cache_user(user)
     return user
 
 
+async def get_current_user(
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_db),
+) -> User:
+    return await _user_from_token(token, db)
+
+
 async def get_approved_user(user: User = Depends(get_current_user)) -> User:
     if user.status != UserStatus.APPROVED:
         raise HTTPException(
@@ -51,3 +61,12 @@ async def get_current_admin(user: User = Depends(get_approved_user)) -> User:
             detail="Admin huquqi kerak",
         )
     return user
+
+
+async def get_stream_user(
+    ticket: str = Query(..., description="From POST /events/ticket; EventSource cannot send headers"),
+    db: AsyncSession = Depends(get_db),
+) -> User:
+    # Query strings end up in access logs, so never the bearer token here:
+    # a short-lived ticket that nothing but /events accepts
+    return await get_approved_user(await _user_from_token(ticket, db, token_type="stream"))
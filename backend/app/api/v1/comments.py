@@ -1,9 +1,10 @@
 from uuid import UUID
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database.session import get_db
+from app.database.session import get_db, get_read_db
 from app.api.deps import get_approved_user
+from app.core.etag import make_etag, etag_matches, not_modified, set_etag
 from app.models.user import User
 from app.schemas.comment import CommentCreate, CommentResponse
 from app.services import comment_service
@@ -14,10 +15,21 @@ router = APIRouter(prefix="/tasks/{task_id}/comments", tags=["Comments"])
 @router.get("/", response_model=list[CommentResponse])
 async def get_comments(
     task_id: UUID,
-    db: AsyncSession = Depends(get_db),
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_approved_user),
 ):
-    return await comment_service.get_comments(db, task_id)
+    fingerprint = await comment_service.get_comments_fingerprint(db, task_id)
+    if fingerprint is None:
+        raise HTTPException(404, "Task topilmadi")
+    etag = make_etag(task_id, *fingerprint)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    comments = await comment_service.get_comments(db, task_id)
+    set_etag(response, etag)
+    return comments
 
 
 @router.post("/", response_model=CommentResponse, status_code=201)
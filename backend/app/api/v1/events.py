@@ -0,0 +1,57 @@
+import asyncio
+import json
+
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import StreamingResponse
+
+from app.api.deps import get_approved_user, get_stream_user
+from app.config import settings
+from app.core.events import broker
+from app.core.security import create_stream_ticket
+from app.models.user import User
+from app.schemas.auth import StreamTicketResponse
+
+router = APIRouter(prefix="/events", tags=["Events"])
+
+
+async def _event_stream(request: Request, user: User):
+    subscriber = broker.subscribe(user)
+    try:
+        yield "retry: 3000\n\n"
+        while not await request.is_disconnected():
+            try:
+                event = await asyncio.wait_for(subscriber.queue.get(), settings.EVENTS_HEARTBEAT_SECONDS)
+            except asyncio.TimeoutError:
+                # Keeps proxies from closing an idle connection
+                yield ": ping\n\n"
+                continue
+            yield f"event: {event['entity']}\ndata: {json.dumps(event)}\n\n"
+    finally:
+        broker.unsubscribe(subscriber)
+
+
+@router.post("/ticket", response_model=StreamTicketResponse)
+async def stream_ticket(current_user: User = Depends(get_approved_user)):
+    return StreamTicketResponse(
+        ticket=create_stream_ticket({"sub": str(current_user.id)}),
+        expires_in=settings.EVENTS_TICKET_EXPIRE_SECONDS,
+    )
+
+
+@router.get("/")
+async def task_events(
+    request: Request,
+    current_user: User = Depends(get_stream_user),
+):
+    """Server-sent events for task and comment changes the user can see.
+
+    ``task`` events carry id, op (insert/update/delete), assigned_to,
+    previous_assigned_to, status, comments_count and updated_at; ``comment``
+    events carry id, op and task_id. A ``resync`` event means events were
+    lost and the client should reload.
+    """
+    return StreamingResponse(
+        _event_stream(request, current_user),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -1,13 +1,17 @@
 from uuid import UUID
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database.session import get_db
+from app.database.session import get_db, get_read_db
 from app.api.deps import get_approved_user, get_current_admin
+from app.core.etag import make_etag, etag_matches, not_modified, set_etag
 from app.models.user import User
 from app.schemas.task import (
     TaskCreate, TaskUpdate, TaskStatusUpdate,
     TaskResponse, TaskListResponse, TaskStatsResponse,
+    TaskBulkRequest, TaskBulkResponse, TaskChangesResponse,
+    TaskOverdueResponse, OverdueAssigneeGroup, TaskBoardResponse,
 )
 from app.services import task_service
 from app.utils.enums import TaskStatus, TaskPriority
@@ -15,49 +19,179 @@ from app.utils.enums import TaskStatus, TaskPriority
 router = APIRouter(prefix="/tasks", tags=["Tasks"])
 
 
+def _json(body: str) -> Response:
+    # Read handlers get their JSON rendered by Postgres; response_model only
+    # documents the shape
+    return Response(content=body, media_type="application/json")
+
+
+def _json_with_etag(request: Request, body: str) -> Response:
+    # Pages are validated by their own rendered body: the cost stays that of
+    # the page, and no cached state can vouch for data that has changed
+    etag = make_etag(body)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    response = _json(body)
+    set_etag(response, etag)
+    return response
+
+
 @router.get("/stats", response_model=TaskStatsResponse)
 async def get_stats(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     admin: User = Depends(get_current_admin),
 ):
     return await task_service.get_stats(db)
 
 
-@router.get("/overdue", response_model=list[TaskResponse])
+@router.get("/overdue", response_model=TaskOverdueResponse)
 async def get_overdue(
+    priority: TaskPriority | None = None,
+    assigned_to: UUID | None = None,
+    limit: int = Query(20, ge=1, le=100),
+    cursor: str | None = None,
+    db: AsyncSession = Depends(get_read_db),
+    admin: User = Depends(get_current_admin),
+):
+    return _json(await task_service.get_overdue_tasks(
+        db, priority=priority, assigned_to=assigned_to, limit=limit, cursor=cursor,
+    ))
+
+
+@router.get("/overdue/by-assignee", response_model=list[OverdueAssigneeGroup])
+async def get_overdue_by_assignee(
+    priority: TaskPriority | None = None,
+    db: AsyncSession = Depends(get_read_db),
+    admin: User = Depends(get_current_admin),
+):
+    return await task_service.get_overdue_by_assignee(db, priority=priority)
+
+
+@router.get("/export")
+async def export_tasks(
+    fmt: str = Query("ndjson", alias="format", pattern="^(ndjson|csv)$"),
+    include_comments: bool = False,
+    status: TaskStatus | None = None,
+    priority: TaskPriority | None = None,
+    assigned_to: UUID | None = None,
+    search: str | None = None,
+    admin: User = Depends(get_current_admin),
+):
+    media_type = "text/csv" if fmt == "csv" else "application/x-ndjson"
+    return StreamingResponse(
+        task_service.export_tasks(
+            admin, fmt=fmt, include_comments=include_comments, status=status,
+            priority=priority, assigned_to=assigned_to, search=search,
+        ),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="tasks.{fmt}"'},
+    )
+
+
+@router.get("/changes", response_model=TaskChangesResponse)
+async def get_task_changes(
+    since: str | None = None,
+    limit: int = Query(100, ge=1, le=500),
+    # Watermarks are only safe against the primary: a lagging replica would
+    # hand out positions past changes it has not replayed yet
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_approved_user),
+):
+    return await task_service.get_task_changes(db, current_user, since=since, limit=limit)
+
+
+# Bulk routes are registered before "/{task_id}" ones so "bulk" is not read as an id
+@router.post("/bulk", response_model=TaskBulkResponse)
+async def bulk_create_tasks(
+    data: TaskBulkRequest,
     db: AsyncSession = Depends(get_db),
     admin: User = Depends(get_current_admin),
 ):
-    return await task_service.get_overdue_tasks(db)
+    return await task_service.bulk_create_tasks(db, data.items, admin)
+
+
+@router.patch("/bulk", response_model=TaskBulkResponse)
+async def bulk_update_tasks(
+    data: TaskBulkRequest,
+    db: AsyncSession = Depends(get_db),
+    admin: User = Depends(get_current_admin),
+):
+    return await task_service.bulk_update_tasks(db, data.items)
+
+
+@router.patch("/bulk/status", response_model=TaskBulkResponse)
+async def bulk_update_task_status(
+    data: TaskBulkRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_approved_user),
+):
+    return await task_service.bulk_update_task_status(db, data.items, current_user)
 
 
 @router.get("/", response_model=TaskListResponse)
 async def get_tasks(
+    request: Request,
     status: TaskStatus | None = None,
     priority: TaskPriority | None = None,
     assigned_to: UUID | None = None,
     search: str | None = None,
-    sort_by: str = "created_at",
+    sort_by: str | None = None,
     order: str = "desc",
     page: int = Query(1, ge=1),
     per_page: int = Query(20, ge=1, le=100),
-    db: AsyncSession = Depends(get_db),
+    cursor: str | None = None,
+    include_total: bool | None = None,
+    estimate_total: bool = False,
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_approved_user),
 ):
-    return await task_service.get_tasks(
+    body = await task_service.get_tasks(
         db, current_user, status=status, priority=priority,
         assigned_to=assigned_to, search=search,
         sort_by=sort_by, order=order, page=page, per_page=per_page,
+        cursor=cursor, include_total=include_total, estimate_total=estimate_total,
+    )
+    return _json_with_etag(request, body)
+
+
+@router.get("/board", response_model=TaskBoardResponse)
+async def get_task_board(
+    request: Request,
+    priority: TaskPriority | None = None,
+    assigned_to: UUID | None = None,
+    search: str | None = None,
+    per_column: int = Query(20, ge=1, le=100),
+    status: TaskStatus | None = None,
+    cursor: str | None = None,
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_approved_user),
+):
+    body = await task_service.get_task_board(
+        db, current_user, priority=priority, assigned_to=assigned_to, search=search,
+        per_column=per_column, status=status, cursor=cursor,
     )
+    return _json_with_etag(request, body)
 
 
 @router.get("/{task_id}", response_model=TaskResponse)
 async def get_task(
     task_id: UUID,
-    db: AsyncSession = Depends(get_db),
+    request: Request,
+    db: AsyncSession = Depends(get_read_db),
     current_user: User = Depends(get_approved_user),
 ):
-    return await task_service.get_task_by_id(db, task_id, current_user)
+    # Revalidation costs one primary-key lookup instead of the full load
+    if request.headers.get("if-none-match"):
+        fingerprint = await task_service.get_task_fingerprint(db, task_id, current_user)
+        if fingerprint is not None:
+            etag = make_etag(task_id, *fingerprint)
+            if etag_matches(request, etag):
+                return not_modified(etag)
+
+    body, fingerprint = await task_service.get_task_by_id(db, task_id, current_user)
+    response = _json(body)
+    set_etag(response, make_etag(task_id, *fingerprint))
+    return response
 
 
 @router.post("/", response_model=TaskResponse, status_code=201)
@@ -1,35 +1,53 @@
 from uuid import UUID
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database.session import get_db
+from app.database.session import get_db, get_read_db
 from app.api.deps import get_current_admin
+from app.core.etag import make_etag, etag_matches, not_modified, set_etag
 from app.models.user import User
 from app.schemas.user import UserResponse, UserListResponse, RoleUpdateRequest
 from app.services import user_service
+from app.utils.enums import UserStatus
 
 router = APIRouter(prefix="/users", tags=["Users"])
 
 
 @router.get("/", response_model=UserListResponse)
 async def get_all_users(
-    db: AsyncSession = Depends(get_db),
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_read_db),
     admin: User = Depends(get_current_admin),
 ):
-    return await user_service.get_all_users(db)
+    etag = make_etag("all", *await user_service.get_users_fingerprint(db))
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    users = await user_service.get_all_users(db)
+    set_etag(response, etag)
+    return users
 
 
 @router.get("/pending", response_model=UserListResponse)
 async def get_pending_users(
-    db: AsyncSession = Depends(get_db),
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_read_db),
     admin: User = Depends(get_current_admin),
 ):
-    return await user_service.get_pending_users(db)
+    etag = make_etag("pending", *await user_service.get_users_fingerprint(db, UserStatus.PENDING))
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    users = await user_service.get_pending_users(db)
+    set_etag(response, etag)
+    return users
 
 
 @router.get("/developers", response_model=list[UserResponse])
 async def get_developers(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     admin: User = Depends(get_current_admin),
 ):
     return await user_service.get_approved_developers(db)
@@ -38,7 +56,7 @@ async def get_developers(
 @router.get("/{user_id}", response_model=UserResponse)
 async def get_user(
     user_id: UUID,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     admin: User = Depends(get_current_admin),
 ):
     return await user_service.get_user_by_id(db, user_id)
@@ -8,6 +8,59 @@ class Settings(BaseSettings):
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
     CORS_ORIGINS: str = "http://localhost:5173,http://localhost:3000"
     INITIAL_ADMIN_EMAIL: str = ""
+    # Exact task list totals are cached per worker for this many seconds
+    TASK_COUNT_CACHE_TTL: int = 30
+    TASK_COUNT_CACHE_SIZE: int = 1024
+    # Authenticated users are cached per worker; every worker drops a user
+    # when the users trigger notifies it, the TTL only bounds how long a
+    # missed notification can keep a stale entry
+    USER_CACHE_TTL: int = 60
+    USER_CACHE_SIZE: int = 10000
+    # bcrypt runs in this many threads per worker, off the event loop
+    PASSWORD_HASH_WORKERS: int = 4
+    # Logins checking a password at once; the rest wait up to the timeout
+    LOGIN_CONCURRENCY: int = 16
+    LOGIN_QUEUE_TIMEOUT: float = 10.0
+    # Connection pool per worker: at most DB_POOL_SIZE + DB_MAX_OVERFLOW
+    # connections; checkouts wait DB_POOL_TIMEOUT seconds before failing
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_PRE_PING: bool = True
+    DB_POOL_RECYCLE: int = 1800
+    DB_STATEMENT_CACHE_SIZE: int = 100
+    DB_STATEMENT_TIMEOUT_MS: int = 30000
+    DB_APPLICATION_NAME: str = "task-manager"
+    # PgBouncer in transaction mode cannot keep prepared statements between
+    # transactions, so statement caches are turned off
+    DB_PGBOUNCER: bool = False
+    # Comma-separated read replica URLs for GET handlers; a replica that fails
+    # to connect is skipped for REPLICA_RETRY_AFTER seconds
+    DATABASE_REPLICA_URLS: str = ""
+    REPLICA_RETRY_AFTER: float = 30.0
+    # After a successful write the client reads from the primary this long
+    READ_YOUR_WRITES_SECONDS: int = 5
+    # Server-sent task/comment events: a separate URL is only needed when
+    # DATABASE_URL goes through PgBouncer (LISTEN needs a session connection)
+    EVENTS_DATABASE_URL: str = ""
+    EVENTS_QUEUE_SIZE: int = 256
+    EVENTS_HEARTBEAT_SECONDS: float = 15.0
+    EVENTS_RECONNECT_SECONDS: float = 2.0
+    # /events takes a ticket in the query string (EventSource cannot send
+    # headers); it is only good for opening a stream, and only this long
+    EVENTS_TICKET_EXPIRE_SECONDS: int = 60
+    # GET /tasks/changes hands out watermarks this far behind the newest
+    # change, so rows from transactions still committing are not skipped
+    SYNC_LAG_SECONDS: float = 5.0
+    # Tombstones older than this are pruned; a since watermark older than
+    # that gets 410 and the client starts over with a full snapshot
+    SYNC_TOMBSTONE_RETENTION_DAYS: int = 30
+    # Requests issuing more SQL statements than this are logged as warnings
+    QUERY_BUDGET: int = 10
+
+    @property
+    def replica_urls_list(self) -> list[str]:
+        return [url.strip() for url in self.DATABASE_REPLICA_URLS.split(",") if url.strip()]
 
     @property
     def cors_origins_list(self) -> list[str]:
@@ -0,0 +1,125 @@
+import asyncio
+import json
+import logging
+from typing import Callable
+
+import asyncpg
+from sqlalchemy.engine import make_url
+
+from app.config import settings
+from app.models.user import User
+from app.utils.enums import UserRole
+
+logger = logging.getLogger("app.events")
+
+# Must match the channel used by the triggers in migration 005
+CHANNEL = "task_changes"
+# Must match the channel used by the triggers in migration 008
+USER_CHANNEL = "user_changes"
+# Sent when a subscriber may have missed events and should reload
+RESYNC_EVENT = {"entity": "resync"}
+
+
+class Subscriber:
+    def __init__(self, user: User):
+        self.user_id = str(user.id)
+        self.is_admin = user.role == UserRole.ADMIN
+        self.queue: asyncio.Queue[dict] = asyncio.Queue(maxsize=settings.EVENTS_QUEUE_SIZE)
+
+    def wants(self, event: dict) -> bool:
+        # Same scope as get_tasks: developers only see their own tasks, plus
+        # the event that takes a task away from them
+        if self.is_admin or event is RESYNC_EVENT:
+            return True
+        return self.user_id in (event.get("assigned_to"), event.get("previous_assigned_to"))
+
+    def push(self, event: dict) -> None:
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # A client this far behind reloads instead of replaying the backlog
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(RESYNC_EVENT)
+
+
+class EventBroker:
+    """One LISTEN connection per worker, fanned out to in-process subscribers."""
+
+    def __init__(self, database_url: str):
+        self._dsn = make_url(database_url).set(drivername="postgresql").render_as_string(hide_password=False)
+        self._subscribers: set[Subscriber] = set()
+        self._listener: asyncio.Task | None = None
+        # Called with each payload on the channel, and with None after a
+        # reconnect, when notifications may have been missed
+        self._handlers: dict[str, list[Callable[[dict | None], None]]] = {CHANNEL: [self._on_task_event]}
+
+    def watch(self, channel: str, handler: Callable[[dict | None], None]) -> None:
+        self._handlers.setdefault(channel, []).append(handler)
+
+    def start(self) -> None:
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen())
+
+    def subscribe(self, user: User) -> Subscriber:
+        self.start()
+        subscriber = Subscriber(user)
+        self._subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        self._subscribers.discard(subscriber)
+
+    def _publish(self, event: dict) -> None:
+        for subscriber in list(self._subscribers):
+            if subscriber.wants(event):
+                subscriber.push(event)
+
+    def _on_task_event(self, event: dict | None) -> None:
+        self._publish(RESYNC_EVENT if event is None else event)
+
+    def _on_notify(self, connection, pid, channel, payload) -> None:
+        event = json.loads(payload)
+        for handler in self._handlers[channel]:
+            handler(event)
+
+    async def _listen(self) -> None:
+        reconnecting = False
+        while True:
+            try:
+                connection = await asyncpg.connect(self._dsn)
+            except (OSError, asyncpg.PostgresError) as e:
+                logger.warning("event listener connect failed: %s", e)
+                await asyncio.sleep(settings.EVENTS_RECONNECT_SECONDS)
+                continue
+
+            closed = asyncio.Event()
+            connection.add_termination_listener(lambda _: closed.set())
+            try:
+                for channel in self._handlers:
+                    await connection.add_listener(channel, self._on_notify)
+                if reconnecting:
+                    # Whatever was sent while disconnected is lost
+                    for handlers in self._handlers.values():
+                        for handler in handlers:
+                            handler(None)
+                await closed.wait()
+            finally:
+                if not connection.is_closed():
+                    await connection.close()
+            reconnecting = True
+            await asyncio.sleep(settings.EVENTS_RECONNECT_SECONDS)
+
+    async def stop(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+
+
+# LISTEN needs a session-level connection, so this must not go through
+# PgBouncer in transaction mode; point EVENTS_DATABASE_URL at Postgres then
+broker = EventBroker(settings.EVENTS_DATABASE_URL or settings.DATABASE_URL)
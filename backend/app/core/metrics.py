@@ -0,0 +1,99 @@
+import asyncio
+import time
+
+from prometheus_client import Counter, Gauge, Histogram
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+from prometheus_client.registry import REGISTRY
+
+# Metrics are per worker process; scrape every worker or run one worker per
+# container when sizing the pool from these numbers
+
+REQUESTS = Counter(
+    "http_requests_total", "HTTP requests by route template", ["method", "route", "status"],
+)
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds", "HTTP request latency by route template", ["method", "route"],
+)
+REQUESTS_IN_FLIGHT = Gauge("http_requests_in_flight", "HTTP requests being handled")
+
+DB_POOL_CHECKOUT = Histogram(
+    "db_pool_checkout_seconds", "Time to get a connection from the SQLAlchemy pool",
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+PASSWORD_HASH = Histogram(
+    "password_hash_seconds", "bcrypt hash/verify time in the worker threads", ["operation"],
+    buckets=(0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1, 2, 5),
+)
+EVENT_LOOP_LAG = Histogram(
+    "event_loop_lag_seconds", "How late the event loop wakes a sleeping task",
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+)
+
+EVENT_LOOP_PROBE_INTERVAL = 0.5
+
+
+class MetricsMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        REQUESTS_IN_FLIGHT.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            REQUESTS_IN_FLIGHT.dec()
+            # Label by route template, never by raw path, to keep cardinality bounded
+            route = scope.get("route")
+            route = getattr(route, "path", "unmatched")
+            REQUEST_LATENCY.labels(scope["method"], route).observe(time.perf_counter() - started)
+            REQUESTS.labels(scope["method"], route, str(status_code)).inc()
+
+
+async def monitor_event_loop() -> None:
+    loop = asyncio.get_running_loop()
+    while True:
+        expected = loop.time() + EVENT_LOOP_PROBE_INTERVAL
+        await asyncio.sleep(EVENT_LOOP_PROBE_INTERVAL)
+        EVENT_LOOP_LAG.observe(max(0.0, loop.time() - expected))
+
+
+class _StateCollector:
+    """Reads pool and cache state only when /metrics is scraped."""
+
+    def __init__(self, engine, caches: dict):
+        self.engine = engine
+        self.caches = caches
+
+    def collect(self):
+        pool = self.engine.pool
+        yield GaugeMetricFamily("db_pool_size", "Configured pool size", value=pool.size())
+        yield GaugeMetricFamily("db_pool_checked_out", "Connections in use", value=pool.checkedout())
+        yield GaugeMetricFamily("db_pool_checked_in", "Idle connections in the pool", value=pool.checkedin())
+        yield GaugeMetricFamily("db_pool_overflow", "Connections opened beyond pool_size", value=pool.overflow())
+
+        size = GaugeMetricFamily("cache_entries", "Entries in in-process caches", labels=["cache"])
+        hits = CounterMetricFamily("cache_hits", "In-process cache hits", labels=["cache"])
+        misses = CounterMetricFamily("cache_misses", "In-process cache misses", labels=["cache"])
+        for name, cache in self.caches.items():
+            stats = cache.stats()
+            size.add_metric([name], stats["size"])
+            hits.add_metric([name], stats["hits"])
+            misses.add_metric([name], stats["misses"])
+        yield from (size, hits, misses)
+
+
+def register_state_metrics(engine, caches: dict) -> None:
+    REGISTRY.register(_StateCollector(engine, caches))
@@ -0,0 +1,43 @@
+from http.cookies import SimpleCookie
+
+from starlette.requests import HTTPConnection
+
+from app.config import settings
+
+# Either one sends reads to the primary: the cookie is set automatically after
+# a successful write, the header lets API clients opt in explicitly
+READ_PRIMARY_COOKIE = "read_primary"
+READ_PRIMARY_HEADER = "x-read-primary"
+
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+
+def wants_primary(request: HTTPConnection) -> bool:
+    return request.headers.get(READ_PRIMARY_HEADER) == "1" or READ_PRIMARY_COOKIE in request.cookies
+
+
+class ReadYourWritesMiddleware:
+    """Marks clients that just wrote so their next reads skip the replicas
+    until replication has most likely caught up."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] in SAFE_METHODS or not settings.replica_urls_list:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cookie(message):
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                cookie = SimpleCookie()
+                cookie[READ_PRIMARY_COOKIE] = "1"
+                cookie[READ_PRIMARY_COOKIE]["max-age"] = settings.READ_YOUR_WRITES_SECONDS
+                cookie[READ_PRIMARY_COOKIE]["path"] = "/"
+                cookie[READ_PRIMARY_COOKIE]["httponly"] = True
+                cookie[READ_PRIMARY_COOKIE]["samesite"] = "lax"
+                header = cookie.output(header="").strip()
+                message.setdefault("headers", []).append((b"set-cookie", header.encode("latin-1")))
+            await send(message)
+
+        await self.app(scope, receive, send_with_cookie)
@@ -0,0 +1,98 @@
+import json
+import logging
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.config import settings
+
+logger = logging.getLogger("app.request")
+
+
+@dataclass
+class RequestStats:
+    queries: int = 0
+    db_time: float = 0.0
+    started: float = field(default_factory=time.perf_counter)
+
+
+# Set by the middleware for the duration of a request; the object itself is
+# shared, so statements run in child tasks or greenlets are counted too
+current_stats: ContextVar[RequestStats | None] = ContextVar("current_stats", default=None)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._query_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = current_stats.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.db_time += time.perf_counter() - context._query_started
+
+
+def install_query_hooks(engine: AsyncEngine) -> None:
+    event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class RequestStatsMiddleware:
+    """Counts SQL statements and DB time per request.
+
+    The numbers go out as a ``Server-Timing`` header (measured when the
+    response starts) and as one JSON log line once the body is sent; requests
+    over ``QUERY_BUDGET`` statements are logged as warnings.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = current_stats.set(stats)
+        status_code = 500
+
+        async def send_with_timing(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                elapsed = (time.perf_counter() - stats.started) * 1000
+                timing = (
+                    f'db;dur={stats.db_time * 1000:.1f};desc="{stats.queries} queries", '
+                    f"app;dur={elapsed:.1f}"
+                )
+                message.setdefault("headers", []).append((b"server-timing", timing.encode()))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            current_stats.reset(token)
+            self._log(scope, stats, status_code)
+
+    @staticmethod
+    def _log(scope, stats: RequestStats, status_code: int) -> None:
+        route = scope.get("route")
+        over_budget = stats.queries > settings.QUERY_BUDGET
+        if not over_budget and not logger.isEnabledFor(logging.INFO):
+            return
+        line = json.dumps({
+            "method": scope["method"],
+            "route": getattr(route, "path", scope["path"]),
+            "status": status_code,
+            "queries": stats.queries,
+            "db_ms": round(stats.db_time * 1000, 2),
+            "total_ms": round((time.perf_counter() - stats.started) * 1000, 2),
+        })
+        if over_budget:
+            logger.warning("query budget exceeded %s", line)
+        else:
+            logger.info(line)
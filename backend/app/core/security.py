@@ -1,10 +1,19 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from passlib.context import CryptContext
 from jose import jwt, JWTError
 from app.config import settings
+from app.core.metrics import PASSWORD_HASH
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# bcrypt releases the GIL, so a few threads keep hashing off the event loop
+_password_executor = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS, thread_name_prefix="bcrypt",
+)
+
 
 def hash_password(password: str) -> str:
     return pwd_context.hash(password)
@@ -14,6 +23,24 @@ def verify_password(plain: str, hashed: str) -> bool:
     return pwd_context.verify(plain, hashed)
 
 
+def _timed(operation: str, func, *args):
+    started = time.perf_counter()
+    try:
+        return func(*args)
+    finally:
+        PASSWORD_HASH.labels(operation).observe(time.perf_counter() - started)
+
+
+async def hash_password_async(password: str) -> str:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_executor, _timed, "hash", hash_password, password)
+
+
+async def verify_password_async(plain: str, hashed: str) -> bool:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_password_executor, _timed, "verify", verify_password, plain, hashed)
+
+
 def create_access_token(data: dict) -> str:
     expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     return jwt.encode({**data, "exp": expire, "type": "access"}, settings.SECRET_KEY, settings.ALGORITHM)
@@ -24,5 +51,10 @@ def create_refresh_token(data: dict) -> str:
     return jwt.encode({**data, "exp": expire, "type": "refresh"}, settings.SECRET_KEY, settings.ALGORITHM)
 
 
+def create_stream_ticket(data: dict) -> str:
+    expire = datetime.utcnow() + timedelta(seconds=settings.EVENTS_TICKET_EXPIRE_SECONDS)
+    return jwt.encode({**data, "exp": expire, "type": "stream"}, settings.SECRET_KEY, settings.ALGORITHM)
+
+
 def decode_token(token: str) -> dict:
     return jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
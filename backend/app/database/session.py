@@ -1,12 +1,114 @@
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+import asyncio
+import itertools
+import time
+import uuid
+from fastapi import Request
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncEngine, AsyncSession
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from app.config import settings
+from app.core.metrics import DB_POOL_CHECKOUT
+from app.core.read_your_writes import wants_primary
 
-engine = create_async_engine(settings.DATABASE_URL, echo=False)
+
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """Records how long each checkout waits for (or opens) a connection."""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_CHECKOUT.observe(time.perf_counter() - started)
+
+
+def _connect_args(read_only: bool = False) -> dict:
+    if settings.DB_PGBOUNCER:
+        # statement_timeout is not a startup parameter PgBouncer passes on;
+        # set it on the database role instead (ALTER ROLE ... SET statement_timeout)
+        return {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+            "server_settings": {"application_name": settings.DB_APPLICATION_NAME},
+        }
+    server_settings = {
+        "application_name": settings.DB_APPLICATION_NAME,
+        "statement_timeout": str(settings.DB_STATEMENT_TIMEOUT_MS),
+    }
+    if read_only:
+        # Keeps replica sessions honest when a replica URL points at the primary
+        server_settings["default_transaction_read_only"] = "on"
+    return {"statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE, "server_settings": server_settings}
+
+
+def _create_engine(url: str, read_only: bool = False) -> AsyncEngine:
+    return create_async_engine(
+        url,
+        echo=False,
+        poolclass=TimedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        connect_args=_connect_args(read_only),
+    )
+
+
+engine = _create_engine(settings.DATABASE_URL)
 async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
+replica_engines = [_create_engine(url, read_only=True) for url in settings.replica_urls_list]
+_replica_sessions = [
+    async_sessionmaker(replica, class_=AsyncSession, expire_on_commit=False) for replica in replica_engines
+]
+_replica_turn = itertools.count()
+# Replica index -> monotonic time until which it is skipped after a failure
+_replica_down_until: dict[int, float] = {}
+
+
 async def get_db():
     async with async_session() as session:
         try:
             yield session
         finally:
             await session.close()
+
+
+async def open_read_session(prefer_primary: bool = False) -> AsyncSession:
+    """Session on the next healthy replica (round-robin), or the primary when
+    there are no replicas, all of them are down or ``prefer_primary`` is set.
+
+    The connection is opened eagerly so a dead replica is detected here and
+    the next one is tried instead of failing the request later.
+    """
+    if not prefer_primary and _replica_sessions:
+        start = next(_replica_turn)
+        for offset in range(len(_replica_sessions)):
+            index = (start + offset) % len(_replica_sessions)
+            if _replica_down_until.get(index, 0) > time.monotonic():
+                continue
+            session = _replica_sessions[index]()
+            try:
+                await session.connection()
+                return session
+            except (DBAPIError, OSError, asyncio.TimeoutError):
+                await session.close()
+                _replica_down_until[index] = time.monotonic() + settings.REPLICA_RETRY_AFTER
+    return async_session()
+
+
+def is_primary(session: AsyncSession) -> bool:
+    return session.bind is engine
+
+
+async def get_read_db(request: Request):
+    """Like ``get_db`` but for read-only handlers, routed through
+    ``open_read_session``. Clients that have just written are sent to the
+    primary (read-your-writes)."""
+    session = await open_read_session(prefer_primary=wants_primary(request))
+    try:
+        yield session
+    finally:
+        await session.close()
@@ -1,20 +1,57 @@
-from fastapi import FastAPI
+import asyncio
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 from app.config import settings
 from app.api.v1.router import api_router
+from app.core.events import CHANNEL, USER_CHANNEL, broker
+from app.core.metrics import MetricsMiddleware, monitor_event_loop, register_state_metrics
+from app.core.read_your_writes import ReadYourWritesMiddleware
+from app.core.request_stats import RequestStatsMiddleware, install_query_hooks
+from app.database.session import engine, replica_engines
+from app.services.task_service import on_task_change, prune_tombstones_periodically, task_count_cache
+from app.services.user_service import on_user_change, user_cache
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    loop_monitor = asyncio.create_task(monitor_event_loop())
+    tombstone_pruner = asyncio.create_task(prune_tombstones_periodically())
+    # Listen from startup, not only once an SSE client connects, so cache
+    # invalidations from other workers always arrive
+    broker.watch(CHANNEL, on_task_change)
+    broker.watch(USER_CHANNEL, on_user_change)
+    broker.start()
+    yield
+    loop_monitor.cancel()
+    tombstone_pruner.cancel()
+    await broker.stop()
+
 
 app = FastAPI(
     title="Task Manager API",
     description="PM uchun vazifalarni boshqarish tizimi",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
+for db_engine in (engine, *replica_engines):
+    install_query_hooks(db_engine)
+register_state_metrics(engine, {
+    "user": user_cache, "task_count": task_count_cache,
+})
+
+app.add_middleware(ReadYourWritesMiddleware)
+app.add_middleware(RequestStatsMiddleware)
+app.add_middleware(MetricsMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.cors_origins_list,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Server-Timing", "ETag"],
 )
 
 app.include_router(api_router)
@@ -22,4 +59,9 @@ app.include_router(api_router)
 
 @app.get("/health")
 async def health_check():
-    return {"status": "ok"}
+    return {"status": "ok", "user_cache": user_cache.stats()}
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
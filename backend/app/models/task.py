@@ -1,13 +1,47 @@
 import uuid
-from sqlalchemy import Column, String, Text, Enum as SQLEnum, ForeignKey, DateTime, func
+from sqlalchemy import Column, Index, Integer, String, Text, Enum as SQLEnum, ForeignKey, DateTime, func, text, literal_column
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, column_property
 from app.database.base import Base
 from app.utils.enums import TaskStatus, TaskPriority
 
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(description, '')), 'B')"
+)
+
+
+def _weighted_vector(column, weight: str):
+    # Literals, not bind parameters, so the query expression matches the index
+    return func.setweight(
+        func.to_tsvector(literal_column("'simple'"), func.coalesce(column, literal_column("''"))),
+        literal_column(f"'{weight}'"),
+    )
+
 
 class Task(Base):
     __tablename__ = "tasks"
+    __table_args__ = (
+        Index("ix_tasks_created_at_id", "created_at", "id"),
+        Index("ix_tasks_assigned_to_created_at", "assigned_to", "created_at", "id"),
+        Index("ix_tasks_status_created_at", "status", "created_at", "id"),
+        Index("ix_tasks_priority_created_at", "priority", "created_at", "id"),
+        Index(
+            "ix_tasks_open_deadline", "deadline", "id",
+            postgresql_where=text("status <> 'done' AND deadline IS NOT NULL"),
+        ),
+        Index(
+            "ix_tasks_open_deadline_assigned_to", "assigned_to", "deadline", "id",
+            postgresql_where=text("status <> 'done' AND deadline IS NOT NULL"),
+        ),
+        Index("ix_tasks_updated_at_id", "updated_at", "id"),
+        Index("ix_tasks_assigned_to_updated_at", "assigned_to", "updated_at", "id"),
+        Index("ix_tasks_search_vector", text(f"({SEARCH_VECTOR_SQL})"), postgresql_using="gin"),
+        Index(
+            "ix_tasks_title_trgm", "title",
+            postgresql_using="gin", postgresql_ops={"title": "gin_trgm_ops"},
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     title = Column(String(255), nullable=False)
@@ -18,9 +52,16 @@ class Task(Base):
     created_by = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     deadline = Column(DateTime(timezone=True), nullable=True)
     completed_at = Column(DateTime(timezone=True), nullable=True)
+    # Maintained by comment_service so responses never need to load comments
+    comments_count = Column(Integer, default=0, server_default="0", nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    # Also bumped by the tasks_touch_updated_at trigger on any row change
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+    # Not stored: computed on the fly and served by the ix_tasks_search_vector expression index
+    search_vector = column_property(
+        _weighted_vector(title, "A").op("||")(_weighted_vector(description, "B")), deferred=True,
+    )
 
     assignee = relationship("User", back_populates="assigned_tasks", foreign_keys=[assigned_to])
     creator = relationship("User", back_populates="created_tasks", foreign_keys=[created_by])
-    comments = relationship("Comment", back_populates="task", cascade="all, delete-orphan", order_by="Comment.created_at")
+    comments = relationship("Comment", back_populates="task", cascade="all, delete-orphan", passive_deletes=True, order_by="Comment.created_at")
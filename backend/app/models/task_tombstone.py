@@ -0,0 +1,20 @@
+from sqlalchemy import BigInteger, Column, DateTime, Identity, Index, String, func
+from sqlalchemy.dialects.postgresql import UUID
+from app.database.base import Base
+
+
+class TaskTombstone(Base):
+    """Written by triggers (migration 006) when a task is deleted or taken
+    away from its assignee, so delta sync can report the removal."""
+
+    __tablename__ = "task_tombstones"
+    __table_args__ = (
+        Index("ix_task_tombstones_deleted_at", "deleted_at", "task_id"),
+        Index("ix_task_tombstones_assigned_to_deleted_at", "assigned_to", "deleted_at", "task_id"),
+    )
+
+    id = Column(BigInteger, Identity(), primary_key=True)
+    task_id = Column(UUID(as_uuid=True), nullable=False)
+    assigned_to = Column(UUID(as_uuid=True), nullable=True)
+    reason = Column(String(20), nullable=False)
+    deleted_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
@@ -43,6 +43,11 @@ class LoginRejectedResponse(BaseModel):
     message: str = "Arizangiz rad etildi"
 
 
+class StreamTicketResponse(BaseModel):
+    ticket: str
+    expires_in: int
+
+
 class RefreshRequest(BaseModel):
     refresh_token: str
 
@@ -1,6 +1,7 @@
+from typing import Any
 from uuid import UUID
 from datetime import datetime
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, field_validator
 from app.utils.enums import TaskStatus, TaskPriority
 from app.schemas.user import UserBrief
 
@@ -20,11 +21,37 @@ class TaskUpdate(BaseModel):
     assigned_to: UUID | None = None
     deadline: datetime | None = None
 
+    # None means "leave as is" only when the field is left out; an explicit
+    # null for a NOT NULL column is rejected here, not by the database
+    @field_validator("title", "priority")
+    @classmethod
+    def not_null(cls, v):
+        if v is None:
+            raise ValueError("null bo'lishi mumkin emas")
+        return v
+
 
 class TaskStatusUpdate(BaseModel):
     status: TaskStatus
 
 
+class TaskBulkUpdateItem(TaskUpdate):
+    id: UUID
+
+
+class TaskBulkStatusItem(TaskStatusUpdate):
+    id: UUID
+
+
+MAX_BULK_ITEMS = 2000
+
+
+class TaskBulkRequest(BaseModel):
+    # Items are validated one by one (TaskCreate, TaskBulkUpdateItem or
+    # TaskBulkStatusItem) so a bad item is reported instead of failing the batch
+    items: list[dict[str, Any]] = Field(..., min_length=1, max_length=MAX_BULK_ITEMS)
+
+
 class TaskResponse(BaseModel):
     id: UUID
     title: str
@@ -42,12 +69,68 @@ class TaskResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class TaskBulkItemResult(BaseModel):
+    index: int
+    task: TaskResponse | None = None
+    error: str | None = None
+
+
+class TaskBulkResponse(BaseModel):
+    items: list[TaskBulkItemResult]
+    succeeded: int
+    failed: int
+
+
 class TaskListResponse(BaseModel):
     items: list[TaskResponse]
-    total: int
-    page: int
+    total: int | None = None
+    page: int | None = None
     per_page: int
-    pages: int
+    pages: int | None = None
+    total_exact: bool = False
+    next_cursor: str | None = None
+
+
+class TaskTombstoneResponse(BaseModel):
+    id: UUID
+    reason: str
+    deleted_at: datetime
+
+
+class TaskChangesResponse(BaseModel):
+    items: list[TaskResponse]
+    deleted: list[TaskTombstoneResponse]
+    # Pass back as ?since= to continue; keep paging while has_more is true
+    next_since: str
+    has_more: bool
+
+
+class TaskBoardColumn(BaseModel):
+    status: TaskStatus
+    # Left out on cursor pages
+    total: int | None = None
+    items: list[TaskResponse]
+    # GET /tasks/board?status=<status>&cursor=<next_cursor>, with the same
+    # filters, loads more of this column
+    next_cursor: str | None = None
+
+
+class TaskBoardResponse(BaseModel):
+    columns: list[TaskBoardColumn]
+    per_column: int
+
+
+class TaskOverdueResponse(BaseModel):
+    items: list[TaskResponse]
+    per_page: int
+    next_cursor: str | None = None
+
+
+class OverdueAssigneeGroup(BaseModel):
+    # None collects unassigned tasks
+    assignee: UserBrief | None
+    count: int
+    oldest_deadline: datetime
 
 
 class TaskStatsResponse(BaseModel):
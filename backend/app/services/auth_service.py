@@ -1,3 +1,4 @@
+import asyncio
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException
@@ -8,10 +9,29 @@ from app.schemas.auth import (
     LoginPendingResponse, LoginRejectedResponse, RefreshRequest,
 )
 from app.schemas.user import UserBrief, UserResponse
-from app.core.security import hash_password, verify_password, create_access_token, create_refresh_token, decode_token
+from app.core.security import hash_password_async, verify_password_async, create_access_token, create_refresh_token, decode_token
 from app.utils.enums import UserRole, UserStatus
 from app.config import settings
 
+# Bounds concurrent password checks so a login burst queues instead of
+# piling up on the bcrypt pool
+_login_slots = asyncio.Semaphore(settings.LOGIN_CONCURRENCY)
+
+
+async def _check_login_password(plain: str, hashed: str) -> bool:
+    try:
+        await asyncio.wait_for(_login_slots.acquire(), settings.LOGIN_QUEUE_TIMEOUT)
+    except asyncio.TimeoutError:
+        raise HTTPException(
+            503,
+            "Server band, birozdan keyin qayta urinib ko'ring",
+            headers={"Retry-After": "1"},
+        )
+    try:
+        return await verify_password_async(plain, hashed)
+    finally:
+        _login_slots.release()
+
 
 async def signup(db: AsyncSession, data: SignupRequest) -> SignupResponse:
     # Check if email exists
@@ -28,7 +48,7 @@ async def signup(db: AsyncSession, data: SignupRequest) -> SignupResponse:
     user = User(
         full_name=data.full_name,
         email=data.email,
-        hashed_password=hash_password(data.password),
+        hashed_password=await hash_password_async(data.password),
         role=UserRole.ADMIN if is_initial_admin else UserRole.DEVELOPER,
         status=UserStatus.APPROVED if is_initial_admin else UserStatus.PENDING,
     )
@@ -48,8 +68,14 @@ async def signup(db: AsyncSession, data: SignupRequest) -> SignupResponse:
 async def login(db: AsyncSession, data: LoginRequest):
     result = await db.execute(select(User).where(User.email == data.email))
     user = result.scalar_one_or_none()
-
-    if not user or not verify_password(data.password, user.hashed_password):
+    # Hand the pooled connection back before queueing for a login slot and
+    # bcrypt, so a login burst cannot starve other endpoints of connections.
+    # Expunged, the user keeps its loaded attributes through the rollback.
+    if user is not None:
+        db.expunge(user)
+    await db.rollback()
+
+    if not user or not await _check_login_password(data.password, user.hashed_password):
         raise HTTPException(401, "Email yoki parol noto'g'ri")
 
     if user.status == UserStatus.PENDING:
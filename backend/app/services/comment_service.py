@@ -1,5 +1,5 @@
 from uuid import UUID
-from sqlalchemy import select
+from sqlalchemy import select, update, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 from fastapi import HTTPException
@@ -9,6 +9,7 @@ from app.models.comment import Comment
 from app.models.user import User
 from app.schemas.comment import CommentCreate, CommentResponse
 from app.schemas.user import UserBrief
+from app.services.task_service import invalidate_task_caches
 from app.utils.enums import UserRole
 
 
@@ -37,11 +38,32 @@ async def get_comments(db: AsyncSession, task_id: UUID) -> list[CommentResponse]
     return [_comment_to_response(c) for c in comments]
 
 
+async def get_comments_fingerprint(db: AsyncSession, task_id: UUID) -> tuple | None:
+    """(count, max(created_at)) of a task's comments, read from the
+    (task_id, created_at) index; comments are never edited in place.
+    None if the task does not exist."""
+    result = await db.execute(
+        select(
+            func.count(),
+            func.max(Comment.created_at),
+            select(Task.id).where(Task.id == task_id).exists(),
+        ).where(Comment.task_id == task_id)
+    )
+    count, last_created_at, task_exists = result.one()
+    return (count, last_created_at) if task_exists else None
+
+
 async def create_comment(
     db: AsyncSession, task_id: UUID, data: CommentCreate, current_user: User,
 ) -> CommentResponse:
-    task = await db.get(Task, task_id)
-    if not task:
+    # Bump the counter first; it doubles as the task existence check
+    result = await db.execute(
+        update(Task)
+        .where(Task.id == task_id)
+        .values(comments_count=Task.comments_count + 1)
+        .returning(Task.id)
+    )
+    if result.scalar_one_or_none() is None:
         raise HTTPException(404, "Task topilmadi")
 
     comment = Comment(
@@ -51,6 +73,7 @@ async def create_comment(
     )
     db.add(comment)
     await db.commit()
+    invalidate_task_caches()
 
     # Reload with author
     result = await db.execute(
@@ -69,4 +92,10 @@ async def delete_comment(db: AsyncSession, comment_id: UUID, current_user: User)
         raise HTTPException(403, "Faqat o'z kommentingizni o'chirish mumkin")
 
     await db.delete(comment)
+    await db.execute(
+        update(Task)
+        .where(Task.id == comment.task_id)
+        .values(comments_count=Task.comments_count - 1)
+    )
     await db.commit()
+    invalidate_task_caches()
@@ -1,165 +1,643 @@
+import asyncio
+import base64
+import csv
+import io
+import json
+import logging
 import math
+import re
+import uuid
+from enum import Enum
 from uuid import UUID
-from datetime import datetime, timezone
-from sqlalchemy import select, func, or_, and_
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator
+from sqlalchemy import (
+    select, insert, update, values, column, cast, func, or_, and_, tuple_, literal, union_all, case, null,
+    String, Text,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 from fastapi import HTTPException
+from pydantic import ValidationError
 
-from app.models.task import Task
+from app.config import settings
+from app.core.cache import TTLCache
+from app.database.explain import Explain
+from app.database.session import async_session, is_primary, open_read_session
 from app.models.comment import Comment
+from app.models.task import Task
+from app.models.task_tombstone import TaskTombstone
 from app.models.user import User
 from app.schemas.task import (
-    TaskCreate, TaskUpdate, TaskResponse, TaskListResponse, TaskStatsResponse,
+    TaskCreate, TaskUpdate, TaskResponse, TaskStatsResponse,
+    TaskBulkUpdateItem, TaskBulkStatusItem, TaskBulkItemResult, TaskBulkResponse,
+    TaskChangesResponse, TaskTombstoneResponse, OverdueAssigneeGroup,
 )
+from app.schemas.comment import CommentResponse
 from app.schemas.user import UserBrief
 from app.utils.enums import UserRole, TaskStatus, TaskPriority, UserStatus
 
 
-def _task_to_response(task: Task) -> TaskResponse:
+logger = logging.getLogger("app.tasks")
+
+tasks_table = Task.__table__
+# Everything a TaskResponse needs
+TASK_COLUMNS = list(tasks_table.c)
+
+
+def _task_rows(source):
+    """Select the task columns of ``source`` (the tasks table or a CTE returning
+    them) joined with the assignee and creator names, in a single statement."""
+    assignee = User.__table__.alias("assignee")
+    creator = User.__table__.alias("creator")
+    return select(
+        *[source.c[column.key] for column in TASK_COLUMNS],
+        assignee.c.full_name.label("assignee_full_name"),
+        assignee.c.email.label("assignee_email"),
+        creator.c.full_name.label("creator_full_name"),
+        creator.c.email.label("creator_email"),
+    ).select_from(
+        source
+        .outerjoin(assignee, assignee.c.id == source.c.assigned_to)
+        .join(creator, creator.c.id == source.c.created_by)
+    )
+
+
+def _utc_iso(column):
+    # Same shape as Pydantic's datetime output, whatever the session TimeZone
+    return func.to_char(func.timezone("UTC", column), 'YYYY-MM-DD"T"HH24:MI:SS.US"Z"')
+
+
+def _user_json(user):
+    return func.json_build_object("id", user.c.id, "full_name", user.c.full_name, "email", user.c.email)
+
+
+def _task_json_rows(source):
+    """Like ``_task_rows``, but each row carries the task already rendered as a
+    TaskResponse JSON object (``body``), plus the columns callers key on."""
+    assignee = User.__table__.alias("assignee")
+    creator = User.__table__.alias("creator")
+    body = func.json_build_object(
+        "id", source.c.id,
+        "title", source.c.title,
+        "description", source.c.description,
+        "status", source.c.status,
+        "priority", source.c.priority,
+        "assignee", case((assignee.c.id.is_(None), null()), else_=_user_json(assignee)),
+        "creator", _user_json(creator),
+        "deadline", _utc_iso(source.c.deadline),
+        "completed_at", _utc_iso(source.c.completed_at),
+        "comments_count", source.c.comments_count,
+        "created_at", _utc_iso(source.c.created_at),
+        "updated_at", _utc_iso(source.c.updated_at),
+    )
+    return select(
+        cast(body, Text).label("body"),
+        source.c.id,
+        source.c.updated_at,
+        source.c.comments_count,
+    ).select_from(
+        source
+        .outerjoin(assignee, assignee.c.id == source.c.assigned_to)
+        .join(creator, creator.c.id == source.c.created_by)
+    )
+
+
+def _json_array(rows) -> str:
+    return "[" + ",".join(row.body for row in rows) + "]"
+
+
+def _row_to_response(row) -> TaskResponse:
     return TaskResponse(
-        id=task.id,
-        title=task.title,
-        description=task.description,
-        status=task.status,
-        priority=task.priority,
-        assignee=UserBrief.model_validate(task.assignee) if task.assignee else None,
-        creator=UserBrief.model_validate(task.creator),
-        deadline=task.deadline,
-        completed_at=task.completed_at,
-        comments_count=len(task.comments) if task.comments else 0,
-        created_at=task.created_at,
-        updated_at=task.updated_at,
+        id=row.id,
+        title=row.title,
+        description=row.description,
+        status=row.status,
+        priority=row.priority,
+        assignee=UserBrief(
+            id=row.assigned_to, full_name=row.assignee_full_name, email=row.assignee_email,
+        ) if row.assigned_to else None,
+        creator=UserBrief(
+            id=row.created_by, full_name=row.creator_full_name, email=row.creator_email,
+        ),
+        deadline=row.deadline,
+        completed_at=row.completed_at,
+        comments_count=row.comments_count,
+        created_at=row.created_at,
+        updated_at=row.updated_at,
     )
 
 
-async def get_tasks(
-    db: AsyncSession,
+# Exact list totals keyed by filter set and user scope, cleared on task and
+# comment writes by this worker and, through the task_changes NOTIFY, by
+# every other one
+task_count_cache = TTLCache(
+    maxsize=settings.TASK_COUNT_CACHE_SIZE, ttl=settings.TASK_COUNT_CACHE_TTL,
+)
+
+
+def invalidate_task_caches() -> None:
+    task_count_cache.clear()
+
+
+def on_task_change(event: dict | None) -> None:
+    # Any task or comment event, or a listener reconnect (None)
+    invalidate_task_caches()
+
+
+def _filter_cache_key(current_user: User, status, priority, assigned_to, search) -> tuple:
+    scope = current_user.id if current_user.role == UserRole.DEVELOPER else None
+    return (scope, status, priority, assigned_to, search)
+
+SORT_COLUMNS = {
+    "created_at": Task.created_at,
+    "updated_at": Task.updated_at,
+    "deadline": Task.deadline,
+    "priority": Task.priority,
+    "status": Task.status,
+    "title": Task.title,
+}
+NULLABLE_SORTS = {"deadline"}
+
+
+def _sort_clauses(sort_column, nullable: bool, order: str) -> list:
+    # Task.id breaks ties so that the order is total and keyset paging is stable.
+    # Only nullable columns get NULLS LAST; for the rest a plain ASC/DESC lets a
+    # (column, id) index serve both directions.
+    if order == "asc":
+        clauses = [sort_column.asc(), Task.id.asc()]
+    else:
+        clauses = [sort_column.desc(), Task.id.desc()]
+    if nullable:
+        clauses[0] = clauses[0].nulls_last()
+    return clauses
+
+
+def _keyset_after(sort_column, nullable: bool, order: str, value, last_id: UUID):
+    if order == "asc":
+        if value is None:
+            return and_(sort_column.is_(None), Task.id > last_id)
+        condition = tuple_(sort_column, Task.id) > tuple_(value, last_id)
+    else:
+        if value is None:
+            return and_(sort_column.is_(None), Task.id < last_id)
+        condition = tuple_(sort_column, Task.id) < tuple_(value, last_id)
+    # NULLs sort last in both directions
+    if nullable:
+        condition = or_(condition, sort_column.is_(None))
+    return condition
+
+
+def _encode_cursor(sort_by: str, order: str, value, task_id: UUID, synced_at: datetime | None = None) -> str:
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    elif isinstance(value, Enum):
+        value = value.value
+    payload = {"s": sort_by, "o": order, "v": value, "id": str(task_id)}
+    if synced_at is not None:
+        payload["t"] = synced_at.isoformat()
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str, sort_by: str, order: str) -> tuple:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded))
+        if payload["s"] != sort_by or payload["o"] != order:
+            raise ValueError("cursor does not match sorting")
+        value = payload["v"]
+        if value is not None:
+            if sort_by == "status":
+                value = TaskStatus(value)
+            elif sort_by == "priority":
+                value = TaskPriority(value)
+            elif sort_by == "relevance":
+                value = float(value)
+            elif sort_by == "title":
+                value = str(value)
+            else:
+                value = datetime.fromisoformat(value)
+        return value, UUID(payload["id"])
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(400, "Cursor yaroqsiz")
+
+
+def _cursor_synced_at(cursor: str) -> datetime | None:
+    # Only called on cursors _decode_cursor has already accepted
+    padded = cursor + "=" * (-len(cursor) % 4)
+    synced_at = json.loads(base64.urlsafe_b64decode(padded)).get("t")
+    try:
+        return datetime.fromisoformat(synced_at) if synced_at else None
+    except (ValueError, TypeError):
+        raise HTTPException(400, "Cursor yaroqsiz")
+
+
+def _search_tsquery(search: str):
+    # Prefix-match every word so partial input still hits the GIN index
+    terms = re.findall(r"[^\W_]+", search.lower())
+    if not terms:
+        return None
+    return func.to_tsquery("simple", " & ".join(f"{term}:*" for term in terms))
+
+
+def _task_filters(
     current_user: User,
     status: TaskStatus | None = None,
     priority: TaskPriority | None = None,
     assigned_to: UUID | None = None,
     search: str | None = None,
-    sort_by: str = "created_at",
-    order: str = "desc",
-    page: int = 1,
-    per_page: int = 20,
-) -> TaskListResponse:
-    query = select(Task).options(
-        selectinload(Task.assignee),
-        selectinload(Task.creator),
-        selectinload(Task.comments),
-    )
+) -> tuple[list, Any]:
+    """WHERE conditions shared by every task listing, plus the search tsquery."""
+    conditions = []
 
     # Developer sees only their assigned tasks
     if current_user.role == UserRole.DEVELOPER:
-        query = query.where(Task.assigned_to == current_user.id)
+        conditions.append(Task.assigned_to == current_user.id)
 
     if status:
-        query = query.where(Task.status == status)
+        conditions.append(Task.status == status)
     if priority:
-        query = query.where(Task.priority == priority)
+        conditions.append(Task.priority == priority)
     if assigned_to:
-        query = query.where(Task.assigned_to == assigned_to)
+        conditions.append(Task.assigned_to == assigned_to)
+    ts_query = None
     if search:
+        # Title substring matches use the trigram index, words in title and
+        # description use the full-text index
+        ts_query = _search_tsquery(search)
+        matches = Task.title.ilike(f"%{search}%")
+        if ts_query is not None:
+            matches = or_(Task.search_vector.op("@@")(ts_query), matches)
+        conditions.append(matches)
+    return conditions, ts_query
+
+
+async def _estimate_count(db: AsyncSession, query) -> int:
+    # Planner row estimate: no table scan, but only as good as the statistics
+    result = await db.execute(Explain(query))
+    plan = result.scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+async def get_tasks(
+    db: AsyncSession,
+    current_user: User,
+    status: TaskStatus | None = None,
+    priority: TaskPriority | None = None,
+    assigned_to: UUID | None = None,
+    search: str | None = None,
+    sort_by: str | None = None,
+    order: str = "desc",
+    page: int = 1,
+    per_page: int = 20,
+    cursor: str | None = None,
+    include_total: bool | None = None,
+    estimate_total: bool = False,
+) -> str:
+    """The TaskListResponse page as a JSON string.
+
+    Rows come back from Postgres already rendered as JSON objects, so no ORM
+    objects or per-row Pydantic models are built; the route returns the string
+    as is instead of validating it against the response model again.
+    """
+    conditions, ts_query = _task_filters(current_user, status, priority, assigned_to, search)
+    query = _task_json_rows(tasks_table).where(*conditions)
+
+    if sort_by is None:
+        sort_by = "relevance" if search else "created_at"
+    if sort_by == "relevance" and search:
+        sort_column = func.similarity(Task.title, search)
+        if ts_query is not None:
+            sort_column = func.ts_rank_cd(Task.search_vector, ts_query) + sort_column
+    else:
+        if sort_by not in SORT_COLUMNS:
+            sort_by = "created_at"
+        sort_column = SORT_COLUMNS[sort_by]
+    order = "asc" if order == "asc" else "desc"
+
+    # Totals are skipped in cursor mode unless asked for explicitly
+    if include_total is None:
+        include_total = cursor is None
+
+    total = None
+    total_exact = False
+    count_source = select(Task.id).where(*conditions)
+    if include_total and estimate_total:
+        total = await _estimate_count(db, count_source)
+    elif include_total:
+        cache_key = _filter_cache_key(current_user, status, priority, assigned_to, search)
+        total = task_count_cache.get(cache_key)
+        if total is None:
+            generation = task_count_cache.generation
+            count_query = select(func.count()).select_from(count_source.subquery())
+            total_result = await db.execute(count_query)
+            total = total_result.scalar()
+            # A replica may lag behind writes that already cleared the cache,
+            # and a write may have committed while this count ran
+            if is_primary(db) and task_count_cache.generation == generation:
+                task_count_cache.set(cache_key, total)
+        total_exact = True
+
+    if cursor:
+        # Keyset mode: seek past the last returned row instead of using OFFSET
+        value, last_id = _decode_cursor(cursor, sort_by, order)
         query = query.where(
-            or_(
-                Task.title.ilike(f"%{search}%"),
-                Task.description.ilike(f"%{search}%"),
-            )
+            _keyset_after(sort_column, sort_by in NULLABLE_SORTS, order, value, last_id)
         )
+    else:
+        query = query.offset((page - 1) * per_page)
 
-    # Count total
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar()
+    # One extra row tells whether another page exists; the sort key is
+    # selected alongside each task so the next cursor can be built from it
+    query = (
+        query.add_columns(sort_column.label("sort_value"))
+        .order_by(*_sort_clauses(sort_column, sort_by in NULLABLE_SORTS, order))
+        .limit(per_page + 1)
+    )
 
-    # Sorting
-    sort_column = getattr(Task, sort_by, Task.created_at)
-    if order == "asc":
-        query = query.order_by(sort_column.asc())
+    result = await db.execute(query)
+    rows = result.all()
+    has_more = len(rows) > per_page
+    rows = rows[:per_page]
+
+    page_info = {
+        "total": total,
+        "page": None if cursor else page,
+        "per_page": per_page,
+        "pages": None if total is None else (math.ceil(total / per_page) if total > 0 else 1),
+        "total_exact": total_exact,
+        "next_cursor": (
+            _encode_cursor(sort_by, order, rows[-1].sort_value, rows[-1].id) if has_more else None
+        ),
+    }
+    return '{"items":' + _json_array(rows) + "," + json.dumps(page_info, separators=(",", ":"))[1:]
+
+
+async def get_task_board(
+    db: AsyncSession,
+    current_user: User,
+    priority: TaskPriority | None = None,
+    assigned_to: UUID | None = None,
+    search: str | None = None,
+    per_column: int = 20,
+    status: TaskStatus | None = None,
+    cursor: str | None = None,
+) -> str:
+    """The first ``per_column`` tasks and the total of every status column, as
+    a TaskBoardResponse JSON string, from one windowed query.
+
+    Columns are ordered by created_at, id descending. ``status`` limits the
+    board to one column and ``cursor`` (that column's next_cursor) continues
+    it under the same filters; like list cursor pages, those skip the total.
+    """
+    if cursor and status is None:
+        raise HTTPException(400, "Cursor bilan status ham berilishi kerak")
+    conditions, _ = _task_filters(current_user, status, priority, assigned_to, search)
+    if cursor:
+        value, last_id = _decode_cursor(cursor, "created_at", "desc")
+        conditions.append(_keyset_after(Task.created_at, False, "desc", value, last_id))
+    column_order = (Task.created_at.desc(), Task.id.desc())
+    # Only ids and sort keys are ranked; JSON is built for the kept rows alone
+    ranked = (
+        select(
+            Task.id,
+            Task.status,
+            Task.created_at,
+            func.row_number().over(partition_by=Task.status, order_by=column_order).label("position"),
+            func.count().over(partition_by=Task.status).label("total"),
+        )
+        .where(*conditions)
+        .subquery("ranked")
+    )
+    task = _task_json_rows(tasks_table).subquery("task")
+    result = await db.execute(
+        select(ranked, task.c.body)
+        .join(task, task.c.id == ranked.c.id)
+        .where(ranked.c.position <= per_column + 1)
+        .order_by(ranked.c.status, ranked.c.position)
+    )
+
+    rows_by_status: dict[TaskStatus, list] = {}
+    for row in result.all():
+        rows_by_status.setdefault(row.status, []).append(row)
+
+    columns = []
+    for column_status in [status] if status else TaskStatus:
+        rows = rows_by_status.get(column_status, [])
+        has_more = len(rows) > per_column
+        rows = rows[:per_column]
+        column_info = {
+            "status": column_status.value,
+            "total": None if cursor else (rows[0].total if rows else 0),
+            "next_cursor": (
+                _encode_cursor("created_at", "desc", rows[-1].created_at, rows[-1].id) if has_more else None
+            ),
+        }
+        columns.append(
+            '{"items":' + _json_array(rows) + "," + json.dumps(column_info, separators=(",", ":"))[1:]
+        )
+    return '{"columns":[' + ",".join(columns) + '],"per_column":' + str(per_column) + "}"
+
+
+async def get_task_fingerprint(db: AsyncSession, task_id: UUID, current_user: User) -> tuple | None:
+    """(updated_at, comments_count) of a task the user may see, else None."""
+    result = await db.execute(
+        select(Task.updated_at, Task.comments_count, Task.assigned_to).where(Task.id == task_id)
+    )
+    row = result.one_or_none()
+    if row is None or (current_user.role == UserRole.DEVELOPER and row.assigned_to != current_user.id):
+        return None
+    return row.updated_at, row.comments_count
+
+
+CHANGES_CURSOR = "changes"
+
+
+def _change_stream(current_user: User, after: tuple | None, limit: int):
+    """Changed tasks and tombstones after the (changed_at, id) position, merged
+    in that order. Each branch is cut to ``limit`` rows off its own index."""
+    tombstones = TaskTombstone.__table__
+    changed = select(
+        Task.id, Task.updated_at.label("changed_at"), literal(None, String).label("reason"),
+    )
+    removed = select(
+        tombstones.c.task_id.label("id"), tombstones.c.deleted_at.label("changed_at"), tombstones.c.reason,
+    )
+    if current_user.role == UserRole.DEVELOPER:
+        changed = changed.where(Task.assigned_to == current_user.id)
+        removed = removed.where(tombstones.c.assigned_to == current_user.id)
     else:
-        query = query.order_by(sort_column.desc())
+        # Unassigning does not hide a task from admins
+        removed = removed.where(tombstones.c.reason == "deleted")
+    if after is not None:
+        changed = changed.where(tuple_(Task.updated_at, Task.id) > tuple_(*after))
+        removed = removed.where(tuple_(tombstones.c.deleted_at, tombstones.c.task_id) > tuple_(*after))
+    changed = changed.order_by(Task.updated_at, Task.id).limit(limit)
+    removed = removed.order_by(tombstones.c.deleted_at, tombstones.c.task_id).limit(limit)
+    return union_all(changed, removed).subquery("changes")
+
 
-    # Pagination
-    query = query.offset((page - 1) * per_page).limit(per_page)
+async def get_task_changes(
+    db: AsyncSession, current_user: User, since: str | None = None, limit: int = 100,
+) -> TaskChangesResponse:
+    """Tasks created or updated and tasks removed from the user's scope since
+    the ``since`` watermark, oldest first. Without ``since`` this is a full
+    snapshot of the visible tasks."""
+    # synced_at: when the client last had everything up to the watermark.
+    # Snapshot pages keep the time the snapshot started, however old the
+    # positions they hand out are.
+    now = datetime.now(timezone.utc)
+    after, synced_at = None, now
+    if since:
+        after = _decode_cursor(since, CHANGES_CURSOR, "asc")
+        synced_at = _cursor_synced_at(since) or after[0]
+        if synced_at < now - timedelta(days=settings.SYNC_TOMBSTONE_RETENTION_DAYS):
+            # Tombstones the client still needs may have been pruned
+            raise HTTPException(status_code=410, detail="since eskirgan, since siz to'liq sinxronlash kerak")
 
+    stream = _change_stream(current_user, after, limit + 1)
+    task = _task_rows(tasks_table).subquery("task")
+    query = (
+        select(
+            stream.c.id.label("change_id"), stream.c.changed_at, stream.c.reason,
+            func.now().label("db_now"), task,
+        )
+        .select_from(stream.outerjoin(task, and_(stream.c.reason.is_(None), task.c.id == stream.c.id)))
+        .order_by(stream.c.changed_at, stream.c.id)
+        .limit(limit + 1)
+    )
     result = await db.execute(query)
-    tasks = result.scalars().unique().all()
-
-    return TaskListResponse(
-        items=[_task_to_response(t) for t in tasks],
-        total=total,
-        page=page,
-        per_page=per_page,
-        pages=math.ceil(total / per_page) if total > 0 else 1,
+    rows = result.all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    items, deleted = [], []
+    for row in rows:
+        if row.reason is not None:
+            deleted.append(TaskTombstoneResponse(id=row.change_id, reason=row.reason, deleted_at=row.changed_at))
+        elif row.id is not None:
+            items.append(_row_to_response(row))
+
+    if rows:
+        position = (rows[-1].changed_at, rows[-1].change_id)
+        if not has_more:
+            # updated_at is the writer's transaction start, so a change can
+            # commit after a later one was already handed out. The last page
+            # leaves a SYNC_LAG_SECONDS window to be sent again next time;
+            # clients apply changes by id, so repeats are harmless.
+            horizon = (rows[-1].db_now - timedelta(seconds=settings.SYNC_LAG_SECONDS), UUID(int=0))
+            position = min(position, horizon)
+    else:
+        position = after
+    if position is None:
+        result = await db.execute(select(func.now()))
+        position = (result.scalar() - timedelta(seconds=settings.SYNC_LAG_SECONDS), UUID(int=0))
+    # A quiet poll or the last page brings the client fully up to date
+    next_since = _encode_cursor(
+        CHANGES_CURSOR, "asc", *position, synced_at=synced_at if has_more else now,
     )
 
+    return TaskChangesResponse(items=items, deleted=deleted, next_since=next_since, has_more=has_more)
+
+
+TOMBSTONE_PRUNE_INTERVAL = 3600
+TOMBSTONE_PRUNE_BATCH = 10000
+
+
+async def prune_task_tombstones(db: AsyncSession) -> int:
+    """Delete tombstones past SYNC_TOMBSTONE_RETENTION_DAYS in small batches."""
+    tombstones = TaskTombstone.__table__
+    cutoff = func.now() - timedelta(days=settings.SYNC_TOMBSTONE_RETENTION_DAYS)
+    deleted = 0
+    while True:
+        batch = (
+            select(tombstones.c.id)
+            .where(tombstones.c.deleted_at < cutoff)
+            .limit(TOMBSTONE_PRUNE_BATCH)
+            .scalar_subquery()
+        )
+        result = await db.execute(tombstones.delete().where(tombstones.c.id.in_(batch)))
+        await db.commit()
+        deleted += result.rowcount
+        if result.rowcount < TOMBSTONE_PRUNE_BATCH:
+            return deleted
+
+
+async def prune_tombstones_periodically() -> None:
+    # Every worker runs this; the deletes are idempotent
+    while True:
+        try:
+            async with async_session() as db:
+                await prune_task_tombstones(db)
+        except Exception as e:
+            logger.warning("tombstone pruning failed: %s", e)
+        await asyncio.sleep(TOMBSTONE_PRUNE_INTERVAL)
 
-async def get_task_by_id(db: AsyncSession, task_id: UUID, current_user: User) -> TaskResponse:
-    query = select(Task).options(
-        selectinload(Task.assignee),
-        selectinload(Task.creator),
-        selectinload(Task.comments),
-    ).where(Task.id == task_id)
+
+async def get_task_by_id(db: AsyncSession, task_id: UUID, current_user: User) -> tuple[str, tuple]:
+    """The TaskResponse as a JSON string, with the (updated_at, comments_count)
+    fingerprint that ``get_task_fingerprint`` would return."""
+    query = _task_json_rows(tasks_table).add_columns(Task.assigned_to).where(Task.id == task_id)
 
     result = await db.execute(query)
-    task = result.scalar_one_or_none()
-    if not task:
+    row = result.one_or_none()
+    if not row:
         raise HTTPException(404, "Task topilmadi")
 
     # Developer can only see their own tasks
-    if current_user.role == UserRole.DEVELOPER and task.assigned_to != current_user.id:
+    if current_user.role == UserRole.DEVELOPER and row.assigned_to != current_user.id:
         raise HTTPException(403, "Bu taskga kirish huquqingiz yo'q")
 
-    return _task_to_response(task)
+    return row.body, (row.updated_at, row.comments_count)
 
 
 async def create_task(db: AsyncSession, data: TaskCreate, admin: User) -> TaskResponse:
-    task = Task(
-        title=data.title,
-        description=data.description,
-        priority=data.priority,
-        assigned_to=data.assigned_to,
-        created_by=admin.id,
-        deadline=data.deadline,
+    inserted = (
+        insert(tasks_table)
+        .values(
+            id=uuid.uuid4(),
+            title=data.title,
+            description=data.description,
+            status=TaskStatus.NEW,
+            priority=data.priority,
+            assigned_to=data.assigned_to,
+            created_by=admin.id,
+            deadline=data.deadline,
+            comments_count=0,
+        )
+        .returning(*TASK_COLUMNS)
+        .cte("task")
     )
-    db.add(task)
+    result = await db.execute(_task_rows(inserted))
+    row = result.one()
     await db.commit()
+    invalidate_task_caches()
 
-    # Reload with relationships
-    query = select(Task).options(
-        selectinload(Task.assignee),
-        selectinload(Task.creator),
-        selectinload(Task.comments),
-    ).where(Task.id == task.id)
-    result = await db.execute(query)
-    task = result.scalar_one()
-
-    return _task_to_response(task)
+    return _row_to_response(row)
 
 
 async def update_task(db: AsyncSession, task_id: UUID, data: TaskUpdate) -> TaskResponse:
-    task = await db.get(Task, task_id)
-    if not task:
-        raise HTTPException(404, "Task topilmadi")
-
     update_data = data.model_dump(exclude_unset=True)
-    for key, value in update_data.items():
-        setattr(task, key, value)
+    if update_data:
+        source = (
+            update(tasks_table)
+            .where(tasks_table.c.id == task_id)
+            .values(**update_data, updated_at=func.now())
+            .returning(*TASK_COLUMNS)
+            .cte("task")
+        )
+    else:
+        source = tasks_table
 
-    db.add(task)
+    result = await db.execute(_task_rows(source).where(source.c.id == task_id))
+    row = result.one_or_none()
+    if not row:
+        raise HTTPException(404, "Task topilmadi")
     await db.commit()
+    invalidate_task_caches()
 
-    query = select(Task).options(
-        selectinload(Task.assignee),
-        selectinload(Task.creator),
-        selectinload(Task.comments),
-    ).where(Task.id == task.id)
-    result = await db.execute(query)
-    task = result.scalar_one()
-
-    return _task_to_response(task)
+    return _row_to_response(row)
 
 
 DEVELOPER_TRANSITIONS = {
@@ -170,55 +648,73 @@ DEVELOPER_TRANSITIONS = {
 }
 
 
+def _status_predecessors(new_status: TaskStatus) -> list[TaskStatus]:
+    return [
+        status for status, targets in DEVELOPER_TRANSITIONS.items()
+        if new_status in targets
+    ]
+
+
 async def update_task_status(
     db: AsyncSession,
     task_id: UUID,
     new_status: TaskStatus,
     current_user: User,
 ) -> TaskResponse:
-    query = select(Task).options(
-        selectinload(Task.assignee),
-        selectinload(Task.creator),
-        selectinload(Task.comments),
-    ).where(Task.id == task_id)
+    # The permission and transition rules are part of the UPDATE itself, so
+    # concurrent transitions cannot both pass the check
+    conditions = [tasks_table.c.id == task_id]
+    if current_user.role == UserRole.DEVELOPER:
+        conditions.append(tasks_table.c.assigned_to == current_user.id)
+        conditions.append(tasks_table.c.status.in_(_status_predecessors(new_status)))
 
-    result = await db.execute(query)
-    task = result.scalar_one_or_none()
-    if not task:
-        raise HTTPException(404, "Task topilmadi")
+    updated = (
+        update(tasks_table)
+        .where(*conditions)
+        .values(
+            status=new_status,
+            completed_at=func.now() if new_status == TaskStatus.DONE else None,
+            updated_at=func.now(),
+        )
+        .returning(*TASK_COLUMNS)
+        .cte("task")
+    )
+    result = await db.execute(_task_rows(updated))
+    row = result.one_or_none()
+    if not row:
+        await _raise_status_update_error(db, task_id, new_status, current_user)
+    await db.commit()
+    invalidate_task_caches()
+
+    return _row_to_response(row)
 
-    if current_user.role == UserRole.ADMIN:
-        pass
-    elif current_user.role == UserRole.DEVELOPER:
+
+def _status_change_error(task, new_status: TaskStatus, current_user: User) -> HTTPException | None:
+    """Why ``current_user`` may not move ``task`` (a row with status and
+    assigned_to, or None if it does not exist) to ``new_status``."""
+    if task is None:
+        return HTTPException(404, "Task topilmadi")
+    if current_user.role == UserRole.DEVELOPER:
         if task.assigned_to != current_user.id:
-            raise HTTPException(403, "Bu task sizga biriktirilmagan")
-        allowed = DEVELOPER_TRANSITIONS.get(task.status, [])
-        if new_status not in allowed:
-            raise HTTPException(
+            return HTTPException(403, "Bu task sizga biriktirilmagan")
+        if new_status not in DEVELOPER_TRANSITIONS.get(task.status, []):
+            return HTTPException(
                 400,
                 f"'{task.status.value}' dan '{new_status.value}' ga o'tish mumkin emas",
             )
+    return None
 
-    task.status = new_status
-    if new_status == TaskStatus.DONE:
-        task.completed_at = datetime.now(timezone.utc)
-    elif task.completed_at and new_status != TaskStatus.DONE:
-        task.completed_at = None
 
-    db.add(task)
-    await db.commit()
-    await db.refresh(task)
-
-    # Reload relationships
-    query = select(Task).options(
-        selectinload(Task.assignee),
-        selectinload(Task.creator),
-        selectinload(Task.comments),
-    ).where(Task.id == task.id)
-    result = await db.execute(query)
-    task = result.scalar_one()
-
-    return _task_to_response(task)
+async def _raise_status_update_error(
+    db: AsyncSession, task_id: UUID, new_status: TaskStatus, current_user: User,
+):
+    # Only reached when the conditional UPDATE matched nothing
+    result = await db.execute(
+        select(Task.status, Task.assigned_to).where(Task.id == task_id)
+    )
+    error = _status_change_error(result.one_or_none(), new_status, current_user)
+    # The row changed between the UPDATE and this check
+    raise error or HTTPException(409, "Task holati o'zgardi, qayta urinib ko'ring")
 
 
 async def delete_task(db: AsyncSession, task_id: UUID):
@@ -227,54 +723,357 @@ async def delete_task(db: AsyncSession, task_id: UUID):
         raise HTTPException(404, "Task topilmadi")
     await db.delete(task)
     await db.commit()
+    invalidate_task_caches()
 
 
-async def get_stats(db: AsyncSession) -> TaskStatsResponse:
-    # Total
-    total_result = await db.execute(select(func.count(Task.id)))
-    total = total_result.scalar()
+BULK_CHUNK_SIZE = 500
 
-    # By status
-    status_result = await db.execute(
-        select(Task.status, func.count(Task.id)).group_by(Task.status)
+
+def _chunks(items: list, size: int):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _validation_error_message(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(loc) for loc in e['loc'])}: {e['msg']}" if e["loc"] else e["msg"]
+        for e in error.errors()
     )
-    by_status = {row[0].value: row[1] for row in status_result.all()}
 
-    # By priority
-    priority_result = await db.execute(
-        select(Task.priority, func.count(Task.id)).group_by(Task.priority)
+
+def _validate_bulk_items(items: list[dict], schema, results: list) -> list[tuple[int, Any]]:
+    valid = []
+    seen_ids = set()
+    for index, raw in enumerate(items):
+        try:
+            item = schema.model_validate(raw)
+        except ValidationError as e:
+            results[index] = TaskBulkItemResult(index=index, error=_validation_error_message(e))
+            continue
+        item_id = getattr(item, "id", None)
+        if item_id is not None:
+            if item_id in seen_ids:
+                results[index] = TaskBulkItemResult(index=index, error="Task takrorlangan")
+                continue
+            seen_ids.add(item_id)
+        valid.append((index, item))
+    return valid
+
+
+async def _existing_user_ids(db: AsyncSession, user_ids: set[UUID]) -> set[UUID]:
+    if not user_ids:
+        return set()
+    result = await db.execute(select(User.id).where(User.id.in_(user_ids)))
+    return set(result.scalars().all())
+
+
+def _bulk_response(results: list) -> TaskBulkResponse:
+    failed = sum(1 for r in results if r.error)
+    return TaskBulkResponse(items=results, succeeded=len(results) - failed, failed=failed)
+
+
+async def bulk_create_tasks(db: AsyncSession, items: list[dict], admin: User) -> TaskBulkResponse:
+    results = [None] * len(items)
+    valid = _validate_bulk_items(items, TaskCreate, results)
+
+    known_users = await _existing_user_ids(
+        db, {data.assigned_to for _, data in valid if data.assigned_to}
     )
-    by_priority = {row[0].value: row[1] for row in priority_result.all()}
+    to_insert = []
+    for index, data in valid:
+        if data.assigned_to and data.assigned_to not in known_users:
+            results[index] = TaskBulkItemResult(index=index, error="Foydalanuvchi topilmadi")
+            continue
+        to_insert.append((index, {
+            "id": uuid.uuid4(),
+            "title": data.title,
+            "description": data.description,
+            "status": TaskStatus.NEW,
+            "priority": data.priority,
+            "assigned_to": data.assigned_to,
+            "created_by": admin.id,
+            "deadline": data.deadline,
+            "comments_count": 0,
+        }))
 
-    # Overdue
-    now = datetime.now(timezone.utc)
-    overdue_result = await db.execute(
-        select(func.count(Task.id)).where(
-            and_(
-                Task.deadline < now,
-                Task.status != TaskStatus.DONE,
-                Task.deadline.isnot(None),
+    # Multi-row INSERT ... RETURNING per chunk, all in one transaction
+    for chunk in _chunks(to_insert, BULK_CHUNK_SIZE):
+        inserted = (
+            insert(tasks_table)
+            .values([row_values for _, row_values in chunk])
+            .returning(*TASK_COLUMNS)
+            .cte("task")
+        )
+        result = await db.execute(_task_rows(inserted))
+        rows = {row.id: row for row in result.all()}
+        for index, row_values in chunk:
+            results[index] = TaskBulkItemResult(
+                index=index, task=_row_to_response(rows[row_values["id"]]),
             )
+
+    await db.commit()
+    invalidate_task_caches()
+    return _bulk_response(results)
+
+
+async def bulk_update_tasks(db: AsyncSession, items: list[dict]) -> TaskBulkResponse:
+    results = [None] * len(items)
+    valid = _validate_bulk_items(items, TaskBulkUpdateItem, results)
+
+    # Lock the rows so a concurrent delete cannot drop them from the UPDATE below
+    result = await db.execute(
+        select(Task.id)
+        .where(Task.id.in_([item.id for _, item in valid]))
+        .with_for_update()
+    )
+    existing = set(result.scalars().all())
+    known_users = await _existing_user_ids(
+        db, {item.assigned_to for _, item in valid if item.assigned_to}
+    )
+
+    # Items changing the same set of fields share one UPDATE ... FROM (VALUES ...)
+    groups: dict[tuple, list] = {}
+    for index, item in valid:
+        if item.id not in existing:
+            results[index] = TaskBulkItemResult(index=index, error="Task topilmadi")
+            continue
+        if item.assigned_to and item.assigned_to not in known_users:
+            results[index] = TaskBulkItemResult(index=index, error="Foydalanuvchi topilmadi")
+            continue
+        changes = item.model_dump(exclude_unset=True, exclude={"id"})
+        groups.setdefault(tuple(sorted(changes)), []).append((index, item.id, changes))
+
+    for fields, group in groups.items():
+        for chunk in _chunks(group, BULK_CHUNK_SIZE):
+            if fields:
+                rows = values(
+                    column("id", tasks_table.c.id.type),
+                    *[column(field, tasks_table.c[field].type) for field in fields],
+                    name="changes",
+                ).data([(task_id, *(changes[f] for f in fields)) for _, task_id, changes in chunk])
+                source = (
+                    update(tasks_table)
+                    .where(tasks_table.c.id == rows.c.id)
+                    .values({
+                        # An all-NULL VALUES column comes back untyped, hence the casts
+                        **{field: cast(rows.c[field], tasks_table.c[field].type) for field in fields},
+                        "updated_at": func.now(),
+                    })
+                    .returning(*TASK_COLUMNS)
+                    .cte("task")
+                )
+            else:
+                source = tasks_table
+            task_ids = [task_id for _, task_id, _ in chunk]
+            result = await db.execute(_task_rows(source).where(source.c.id.in_(task_ids)))
+            updated = {row.id: row for row in result.all()}
+            for index, task_id, _ in chunk:
+                results[index] = TaskBulkItemResult(
+                    index=index, task=_row_to_response(updated[task_id]),
+                )
+
+    await db.commit()
+    invalidate_task_caches()
+    return _bulk_response(results)
+
+
+async def bulk_update_task_status(
+    db: AsyncSession, items: list[dict], current_user: User,
+) -> TaskBulkResponse:
+    results = [None] * len(items)
+    valid = _validate_bulk_items(items, TaskBulkStatusItem, results)
+
+    # Lock the rows so the transition checks below hold until commit
+    result = await db.execute(
+        select(Task.id, Task.status, Task.assigned_to)
+        .where(Task.id.in_([item.id for _, item in valid]))
+        .with_for_update()
+    )
+    current = {row.id: row for row in result.all()}
+
+    by_status: dict[TaskStatus, list] = {}
+    for index, item in valid:
+        error = _status_change_error(current.get(item.id), item.status, current_user)
+        if error:
+            results[index] = TaskBulkItemResult(index=index, error=error.detail)
+            continue
+        by_status.setdefault(item.status, []).append((index, item.id))
+
+    for new_status, group in by_status.items():
+        for chunk in _chunks(group, BULK_CHUNK_SIZE):
+            task_ids = [task_id for _, task_id in chunk]
+            updated = (
+                update(tasks_table)
+                .where(tasks_table.c.id.in_(task_ids))
+                .values(
+                    status=new_status,
+                    completed_at=func.now() if new_status == TaskStatus.DONE else None,
+                    updated_at=func.now(),
+                )
+                .returning(*TASK_COLUMNS)
+                .cte("task")
+            )
+            result = await db.execute(_task_rows(updated))
+            rows = {row.id: row for row in result.all()}
+            for index, task_id in chunk:
+                results[index] = TaskBulkItemResult(
+                    index=index, task=_row_to_response(rows[task_id]),
+                )
+
+    await db.commit()
+    invalidate_task_caches()
+    return _bulk_response(results)
+
+
+EXPORT_BATCH_SIZE = 1000
+EXPORT_CSV_COLUMNS = [
+    "id", "title", "description", "status", "priority",
+    "assignee_id", "assignee_email", "creator_id", "creator_email",
+    "deadline", "completed_at", "comments_count", "created_at", "updated_at",
+]
+
+
+async def _comments_by_task(db: AsyncSession, task_ids: list[UUID]) -> dict[UUID, list[dict]]:
+    result = await db.execute(
+        select(Comment.id, Comment.task_id, Comment.text, Comment.created_at, User.id.label("author_id"),
+               User.full_name, User.email)
+        .join(User, User.id == Comment.author_id)
+        .where(Comment.task_id.in_(task_ids))
+        .order_by(Comment.task_id, Comment.created_at)
+    )
+    comments: dict[UUID, list[dict]] = {}
+    for row in result.all():
+        comment = CommentResponse(
+            id=row.id,
+            text=row.text,
+            author=UserBrief(id=row.author_id, full_name=row.full_name, email=row.email),
+            created_at=row.created_at,
         )
+        comments.setdefault(row.task_id, []).append(comment.model_dump(mode="json"))
+    return comments
+
+
+def _csv_line(values: list) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(values)
+    return buffer.getvalue()
+
+
+async def export_tasks(
+    current_user: User,
+    fmt: str = "ndjson",
+    include_comments: bool = False,
+    status: TaskStatus | None = None,
+    priority: TaskPriority | None = None,
+    assigned_to: UUID | None = None,
+    search: str | None = None,
+) -> AsyncIterator[str]:
+    """Yield the filtered tasks as NDJSON lines or CSV rows.
+
+    Rows come from a server-side cursor in batches of EXPORT_BATCH_SIZE, so
+    memory stays flat whatever the result size. The generator opens its own
+    session because it keeps running after the request handler has returned.
+    """
+    conditions, _ = _task_filters(current_user, status, priority, assigned_to, search)
+    query = (
+        _task_rows(tasks_table)
+        .where(*conditions)
+        .order_by(tasks_table.c.created_at, tasks_table.c.id)
+        .execution_options(yield_per=EXPORT_BATCH_SIZE)
     )
-    overdue_count = overdue_result.scalar()
 
-    # By developer
-    dev_result = await db.execute(
+    if fmt == "csv":
+        yield _csv_line(EXPORT_CSV_COLUMNS + (["comments"] if include_comments else []))
+
+    async with await open_read_session() as db:
+        result = await db.stream(query)
+        async for rows in result.partitions():
+            comments = {}
+            if include_comments:
+                comments = await _comments_by_task(db, [row.id for row in rows])
+
+            lines = []
+            for row in rows:
+                task = _row_to_response(row).model_dump(mode="json")
+                if fmt == "csv":
+                    values = [
+                        task["id"], task["title"], task["description"], task["status"],
+                        task["priority"], row.assigned_to, row.assignee_email,
+                        row.created_by, row.creator_email, task["deadline"],
+                        task["completed_at"], task["comments_count"], task["created_at"],
+                        task["updated_at"],
+                    ]
+                    if include_comments:
+                        values.append(json.dumps(comments.get(row.id, []), ensure_ascii=False))
+                    lines.append(_csv_line(values))
+                else:
+                    if include_comments:
+                        task["comments"] = comments.get(row.id, [])
+                    lines.append(json.dumps(task, ensure_ascii=False) + "\n")
+            yield "".join(lines)
+
+
+async def get_stats(db: AsyncSession) -> TaskStatsResponse:
+    # Totals, per-status, per-priority and per-developer counts in a single
+    # pass over tasks; grouping() tells which grouping set a row belongs to
+    now = datetime.now(timezone.utc)
+    overdue = and_(
+        Task.deadline < now,
+        Task.status != TaskStatus.DONE,
+        Task.deadline.isnot(None),
+    )
+    query = (
         select(
+            func.grouping(Task.status).label("by_status"),
+            func.grouping(Task.priority).label("by_priority"),
+            func.grouping(User.id).label("by_developer"),
+            Task.status,
+            Task.priority,
             User.id,
             User.full_name,
             func.count(Task.id).label("total"),
             func.count(Task.id).filter(Task.status == TaskStatus.DONE).label("done"),
+            func.count(Task.id).filter(overdue).label("overdue"),
+        )
+        .select_from(Task)
+        .outerjoin(
+            User,
+            and_(
+                User.id == Task.assigned_to,
+                User.role == UserRole.DEVELOPER,
+                User.status == UserStatus.APPROVED,
+            ),
+        )
+        .group_by(
+            func.grouping_sets(
+                tuple_(),
+                tuple_(Task.status),
+                tuple_(Task.priority),
+                tuple_(User.id, User.full_name),
+            )
         )
-        .join(Task, Task.assigned_to == User.id)
-        .where(User.role == UserRole.DEVELOPER, User.status == UserStatus.APPROVED)
-        .group_by(User.id, User.full_name)
     )
-    by_developer = [
-        {"id": str(row[0]), "name": row[1], "total": row[2], "done": row[3]}
-        for row in dev_result.all()
-    ]
+    result = await db.execute(query)
+
+    total = 0
+    overdue_count = 0
+    by_status = {}
+    by_priority = {}
+    by_developer = []
+    for row in result.all():
+        if row.by_status == 0:
+            by_status[row.status.value] = row.total
+        elif row.by_priority == 0:
+            by_priority[row.priority.value] = row.total
+        elif row.by_developer == 0:
+            # Tasks without an approved developer assignee group under NULL
+            if row.id is not None:
+                by_developer.append(
+                    {"id": str(row.id), "name": row.full_name, "total": row.total, "done": row.done}
+                )
+        else:
+            total = row.total
+            overdue_count = row.overdue
 
     return TaskStatsResponse(
         total_tasks=total,
@@ -285,20 +1084,76 @@ async def get_stats(db: AsyncSession) -> TaskStatsResponse:
     )
 
 
-async def get_overdue_tasks(db: AsyncSession) -> list[TaskResponse]:
-    now = datetime.now(timezone.utc)
-    query = select(Task).options(
-        selectinload(Task.assignee),
-        selectinload(Task.creator),
-        selectinload(Task.comments),
-    ).where(
-        and_(
-            Task.deadline < now,
-            Task.status != TaskStatus.DONE,
-            Task.deadline.isnot(None),
-        )
-    ).order_by(Task.deadline.asc())
+def _overdue_filters(priority: TaskPriority | None = None, assigned_to: UUID | None = None) -> list:
+    # Matches the ix_tasks_open_deadline* partial indexes, so only open tasks
+    # with a deadline are ever read
+    conditions = [
+        Task.status != TaskStatus.DONE,
+        Task.deadline.isnot(None),
+        Task.deadline < datetime.now(timezone.utc),
+    ]
+    if priority:
+        conditions.append(Task.priority == priority)
+    if assigned_to:
+        conditions.append(Task.assigned_to == assigned_to)
+    return conditions
+
+
+async def get_overdue_tasks(
+    db: AsyncSession,
+    priority: TaskPriority | None = None,
+    assigned_to: UUID | None = None,
+    limit: int = 20,
+    cursor: str | None = None,
+) -> str:
+    """One page of overdue tasks, oldest deadline first, as a
+    TaskOverdueResponse JSON string."""
+    query = _task_json_rows(tasks_table).add_columns(Task.deadline).where(
+        *_overdue_filters(priority, assigned_to)
+    )
+    if cursor:
+        deadline, last_id = _decode_cursor(cursor, "deadline", "asc")
+        query = query.where(tuple_(Task.deadline, Task.id) > tuple_(deadline, last_id))
+    query = query.order_by(Task.deadline.asc(), Task.id.asc()).limit(limit + 1)
 
     result = await db.execute(query)
-    tasks = result.scalars().unique().all()
-    return [_task_to_response(t) for t in tasks]
+    rows = result.all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    page_info = {
+        "per_page": limit,
+        "next_cursor": _encode_cursor("deadline", "asc", rows[-1].deadline, rows[-1].id) if has_more else None,
+    }
+    return '{"items":' + _json_array(rows) + "," + json.dumps(page_info, separators=(",", ":"))[1:]
+
+
+async def get_overdue_by_assignee(
+    db: AsyncSession, priority: TaskPriority | None = None,
+) -> list[OverdueAssigneeGroup]:
+    """Overdue task counts per assignee, largest first. Reads only the
+    (assigned_to, deadline) partial index, not the task rows."""
+    overdue = (
+        select(
+            Task.assigned_to,
+            func.count().label("count"),
+            func.min(Task.deadline).label("oldest_deadline"),
+        )
+        .where(*_overdue_filters(priority))
+        .group_by(Task.assigned_to)
+        .subquery()
+    )
+    result = await db.execute(
+        select(overdue, User.full_name, User.email)
+        .outerjoin(User, User.id == overdue.c.assigned_to)
+        .order_by(overdue.c.count.desc(), overdue.c.oldest_deadline)
+    )
+    return [
+        OverdueAssigneeGroup(
+            assignee=UserBrief(id=row.assigned_to, full_name=row.full_name, email=row.email)
+            if row.assigned_to else None,
+            count=row.count,
+            oldest_deadline=row.oldest_deadline,
+        )
+        for row in result.all()
+    ]
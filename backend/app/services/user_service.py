@@ -3,10 +3,45 @@ from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException
 
+from app.config import settings
+from app.core.cache import TTLCache
 from app.models.user import User
 from app.schemas.user import UserResponse, UserListResponse
 from app.utils.enums import UserRole, UserStatus
 
+# Snapshot of the fields request handling reads from the current user, keyed
+# by user id; filled by get_current_user and dropped whenever those change
+user_cache = TTLCache(maxsize=settings.USER_CACHE_SIZE, ttl=settings.USER_CACHE_TTL)
+CACHED_USER_FIELDS = ("id", "full_name", "email", "role", "status", "created_at", "updated_at")
+
+
+def cache_user(user: User) -> None:
+    user_cache.set(user.id, {field: getattr(user, field) for field in CACHED_USER_FIELDS})
+
+
+def on_user_change(event: dict | None) -> None:
+    # Broadcast by the users triggers (migration 008) to every worker; None
+    # means notifications may have been missed, so forget everyone
+    if event is None:
+        user_cache.clear()
+    else:
+        user_cache.delete(UUID(event["id"]))
+
+
+def get_cached_user(user_id: UUID) -> User | None:
+    # Detached, read-only copy: never add it to a session
+    snapshot = user_cache.get(user_id)
+    return User(**snapshot) if snapshot is not None else None
+
+
+async def get_users_fingerprint(db: AsyncSession, status: UserStatus | None = None) -> tuple:
+    """(count, max(updated_at)) of users, optionally filtered by status."""
+    query = select(func.count(), func.max(User.updated_at))
+    if status is not None:
+        query = query.where(User.status == status)
+    result = await db.execute(query)
+    return tuple(result.one())
+
 
 async def get_all_users(db: AsyncSession) -> UserListResponse:
     result = await db.execute(select(User).order_by(User.created_at.desc()))
@@ -58,6 +93,7 @@ async def approve_user(db: AsyncSession, user_id: UUID, admin_id: UUID) -> UserR
     db.add(user)
     await db.commit()
     await db.refresh(user)
+    user_cache.delete(user.id)
     return UserResponse.model_validate(user)
 
 
@@ -72,6 +108,7 @@ async def reject_user(db: AsyncSession, user_id: UUID) -> UserResponse:
     db.add(user)
     await db.commit()
     await db.refresh(user)
+    user_cache.delete(user.id)
     return UserResponse.model_validate(user)
 
 
@@ -84,4 +121,5 @@ async def change_role(db: AsyncSession, user_id: UUID, role: UserRole) -> UserRe
     db.add(user)
     await db.commit()
     await db.refresh(user)
+    user_cache.delete(user.id)
     return UserResponse.model_validate(user)
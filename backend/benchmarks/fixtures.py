@@ -0,0 +1,59 @@
+import random
+import uuid
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone, timedelta
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+
+from app.core.security import hash_password
+from app.database.session import async_session
+from app.models.task import Task
+from app.models.user import User
+from app.services.import_service import load_tasks_chunk, load_comments_chunk
+from app.utils.enums import UserRole, UserStatus, TaskStatus, TaskPriority
+
+
+@asynccontextmanager
+async def comment_fixtures(levels: list[int], tasks_per_level: int):
+    """Create one developer per level whose tasks each carry exactly ``level``
+    comments, yield ``{level: user_id}`` and remove everything afterwards."""
+    rng = random.Random(0)
+    now = datetime.now(timezone.utc)
+    password = hash_password(uuid.uuid4().hex)
+    users = {
+        level: uuid.uuid5(uuid.NAMESPACE_URL, f"bench-comments-{level}@example.com")
+        for level in levels
+    }
+
+    async with async_session() as db:
+        admin_id = (await db.execute(select(User.id).where(User.role == UserRole.ADMIN).limit(1))).scalar_one()
+        await db.execute(insert(User).values([
+            {"id": user_id, "full_name": f"Bench {level}", "email": f"bench-comments-{level}@example.com",
+             "hashed_password": password, "role": UserRole.DEVELOPER, "status": UserStatus.APPROVED}
+            for level, user_id in users.items()
+        ]).on_conflict_do_nothing(index_elements=["email"]))
+
+        for level, user_id in users.items():
+            tasks = [
+                (uuid.uuid4(), f"Bench {level} kommentli task {i}", None, TaskStatus.IN_PROGRESS.value,
+                 TaskPriority.MEDIUM.value, user_id, admin_id, None, None, 0,
+                 now - timedelta(minutes=i), now - timedelta(minutes=i))
+                for i in range(tasks_per_level)
+            ]
+            await load_tasks_chunk(db, tasks, stamp_updated_at=False)
+            comments = [
+                (uuid.uuid4(), "x" * rng.randint(20, 400), task[0], user_id, now, now)
+                for task in tasks for _ in range(level)
+            ]
+            for start in range(0, len(comments), 50000):
+                await load_comments_chunk(db, comments[start:start + 50000], stamp_updated_at=False)
+        await db.commit()
+
+    try:
+        yield users
+    finally:
+        async with async_session() as db:
+            await db.execute(delete(Task).where(Task.assigned_to.in_(users.values())))
+            await db.execute(delete(User).where(User.id.in_(users.values())))
+            await db.commit()
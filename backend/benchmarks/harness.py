@@ -0,0 +1,138 @@
+import asyncio
+import statistics
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Awaitable, Callable
+
+import httpx
+from sqlalchemy import event
+
+from app.database.session import engine
+
+RequestFn = Callable[[httpx.AsyncClient, dict], Awaitable[httpx.Response]]
+
+
+@dataclass
+class Scenario:
+    name: str
+    request: RequestFn
+    # Runs in a loop while the scenario is measured, e.g. logins hammering bcrypt
+    background: RequestFn | None = None
+    background_concurrency: int = 4
+
+
+class QueryCounter:
+    """Counts statements sent to Postgres through the app engine."""
+
+    def __init__(self):
+        self.count = 0
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+
+    def __enter__(self):
+        self.count = 0
+        event.listen(engine.sync_engine, "before_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(engine.sync_engine, "before_cursor_execute", self._on_execute)
+
+
+def percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+async def _profile(client: httpx.AsyncClient, ctx: dict, scenario: Scenario, samples: int) -> dict:
+    # Sequential pass: with one request in flight the statement counter and
+    # tracemalloc peak can be attributed to a single request
+    tracemalloc.start()
+    peaks = []
+    try:
+        with QueryCounter() as queries:
+            for _ in range(samples):
+                tracemalloc.reset_peak()
+                await scenario.request(client, ctx)
+                peaks.append(tracemalloc.get_traced_memory()[1])
+    finally:
+        tracemalloc.stop()
+    return {
+        "queries_per_request": round(queries.count / samples, 2),
+        "peak_memory_kb": round(max(peaks) / 1024, 1),
+    }
+
+
+async def _background_loop(client: httpx.AsyncClient, ctx: dict, request: RequestFn, stop: asyncio.Event) -> int:
+    done = 0
+    while not stop.is_set():
+        await request(client, ctx)
+        done += 1
+    return done
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    ctx: dict,
+    scenario: Scenario,
+    requests: int,
+    concurrency: int,
+    warmup: int,
+) -> dict:
+    for _ in range(warmup):
+        await scenario.request(client, ctx)
+
+    profile = await _profile(client, ctx, scenario, samples=max(1, min(20, requests)))
+
+    stop = asyncio.Event()
+    background = []
+    if scenario.background:
+        background = [
+            asyncio.create_task(_background_loop(client, ctx, scenario.background, stop))
+            for _ in range(scenario.background_concurrency)
+        ]
+
+    latencies: list[float] = []
+    errors = 0
+    remaining = iter(range(requests))
+
+    async def worker():
+        nonlocal errors
+        for _ in remaining:
+            started = time.perf_counter()
+            response = await scenario.request(client, ctx)
+            latencies.append(time.perf_counter() - started)
+            if response.status_code >= 400:
+                errors += 1
+
+    cpu_started = time.process_time()
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    cpu = time.process_time() - cpu_started
+
+    stop.set()
+    background_done = sum(await asyncio.gather(*background))
+
+    ms = [latency * 1000 for latency in latencies]
+    result = {
+        "requests": requests,
+        "concurrency": concurrency,
+        "errors": errors,
+        "throughput_rps": round(requests / elapsed, 1),
+        "mean_ms": round(statistics.fmean(ms), 2),
+        "p50_ms": round(percentile(ms, 50), 2),
+        "p95_ms": round(percentile(ms, 95), 2),
+        "p99_ms": round(percentile(ms, 99), 2),
+        "max_ms": round(max(ms), 2),
+        # Client and server share the process, so this is an upper bound
+        "cpu_ms_per_request": round(cpu * 1000 / requests, 3),
+        **profile,
+    }
+    if scenario.background:
+        result["background_requests"] = background_done
+    return result
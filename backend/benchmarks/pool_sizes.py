@@ -0,0 +1,72 @@
+"""Pool size benchmark - throughput DB_POOL_SIZE ga qarab
+
+    python -m benchmarks.pool_sizes --sizes 2,5,10,20,40 --concurrency 50
+
+Har bir o'lcham alohida jarayonda (benchmarks.run) ishga tushiriladi, chunki
+engine import paytida settings dan yaratiladi.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+
+from benchmarks.run import RESULTS_DIR
+
+DEFAULT_SCENARIOS = "tasks_list,task_detail,task_status"
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Throughput va pool o'lchami")
+    parser.add_argument("--sizes", default="2,5,10,20,40")
+    parser.add_argument("--max-overflow", type=int, default=0)
+    parser.add_argument("--scenarios", default=DEFAULT_SCENARIOS)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--output", type=Path)
+    return parser.parse_known_args()
+
+
+def run_size(size: int, args, extra: list[str]) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        output = Path(tmp) / "result.json"
+        env = {**os.environ, "DB_POOL_SIZE": str(size), "DB_MAX_OVERFLOW": str(args.max_overflow)}
+        subprocess.run(
+            [sys.executable, "-m", "benchmarks.run", "--scenarios", args.scenarios, "--comment-levels", "",
+             "--requests", str(args.requests), "--concurrency", str(args.concurrency),
+             "--output", str(output), *extra],
+            env=env, check=True, stdout=subprocess.DEVNULL,
+        )
+        return json.loads(output.read_text())["results"]
+
+
+def main() -> None:
+    args, extra = parse_args()
+    sizes = [int(size) for size in args.sizes.split(",")]
+    scenarios = args.scenarios.split(",")
+    results = {}
+
+    print(f"{'pool':>5} " + " ".join(f"{name + ' req/s':>24} {'p95 ms':>9}" for name in scenarios))
+    for size in sizes:
+        results[size] = run_size(size, args, extra)
+        print(f"{size:>5} " + " ".join(
+            f"{results[size][name]['throughput_rps']:>24.1f} {results[size][name]['p95_ms']:>9.2f}"
+            for name in scenarios
+        ), flush=True)
+
+    output = args.output or RESULTS_DIR / f"pool_sizes_{datetime.now(timezone.utc):%Y%m%dT%H%M%SZ}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps({
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "config": {"requests": args.requests, "concurrency": args.concurrency,
+                   "max_overflow": args.max_overflow},
+        "results": results,
+    }, indent=2))
+    print(f"\nNatijalar: {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""API benchmark - hot endpointlarni seed qilingan lokal Postgresda o'lchash
+
+    python seed.py --users 500 --tasks 200000 --seed 42
+    python -m benchmarks.run
+    python -m benchmarks.run --scenarios tasks_list,task_detail --requests 1000
+    python -m benchmarks.run --compare benchmarks/results/baseline.json
+
+Natijalar benchmarks/results/<vaqt>.json ga yoziladi.
+"""
+import argparse
+import asyncio
+import json
+import subprocess
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+import httpx
+
+from app.config import settings
+from app.main import app
+from benchmarks.fixtures import comment_fixtures
+from benchmarks.harness import run_scenario
+from benchmarks.scenarios import SCENARIOS, build_context, comment_scaling_scenarios
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="API benchmark")
+    parser.add_argument("--scenarios", help="vergul bilan ajratilgan nomlar (standart: hammasi)")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--warmup", type=int, default=5)
+    parser.add_argument("--comment-levels", default="0,100,10000",
+                        help="tasks_list_comments_<n> uchun har bir taskdagi kommentlar soni; bo'sh — o'tkazib yuborish")
+    parser.add_argument("--output", type=Path)
+    parser.add_argument("--compare", type=Path, help="oldingi natija fayli bilan solishtirish")
+    parser.add_argument("--threshold", type=float, default=0.2, help="p95 uchun ruxsat etilgan o'sish (0.2 = 20%%)")
+    parser.add_argument("--admin-email", default=settings.INITIAL_ADMIN_EMAIL or "admin@example.com")
+    parser.add_argument("--admin-password", default="Admin1234")
+    parser.add_argument("--dev-email", default="ali@example.com")
+    parser.add_argument("--dev-password", default="Developer1")
+    return parser.parse_args()
+
+
+def git_revision() -> str | None:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True,
+                                       stderr=subprocess.DEVNULL).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_row(name: str, result: dict) -> None:
+    print(
+        f"{name:<28} {result['throughput_rps']:>9.1f} {result['p50_ms']:>9.2f} {result['p95_ms']:>9.2f} "
+        f"{result['p99_ms']:>9.2f} {result['queries_per_request']:>7.2f} {result['cpu_ms_per_request']:>8.2f} "
+        f"{result['errors']:>6}",
+        flush=True,
+    )
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    regressions = []
+    print(f"\n{'scenario':<28} {'p95 old':>9} {'p95 new':>9} {'delta':>8} {'q old':>6} {'q new':>6} "
+          f"{'cpu old':>8} {'cpu new':>8}")
+    for name, new in results.items():
+        old = baseline.get(name)
+        if old is None:
+            continue
+        delta = (new["p95_ms"] - old["p95_ms"]) / old["p95_ms"] if old["p95_ms"] else 0.0
+        print(f"{name:<28} {old['p95_ms']:>9.2f} {new['p95_ms']:>9.2f} {delta:>+7.0%} "
+              f"{old['queries_per_request']:>6.2f} {new['queries_per_request']:>6.2f} "
+              f"{old['cpu_ms_per_request']:>8.2f} {new['cpu_ms_per_request']:>8.2f}")
+        if delta > threshold:
+            regressions.append(f"{name}: p95 {delta:+.0%}")
+        if new["queries_per_request"] > old["queries_per_request"]:
+            regressions.append(f"{name}: so'rovlar {old['queries_per_request']} -> {new['queries_per_request']}")
+    return regressions
+
+
+async def main(args) -> int:
+    selected = set(args.scenarios.split(",")) if args.scenarios else None
+    levels = [int(level) for level in args.comment_levels.split(",") if level]
+    results = {}
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench/api/v1", timeout=120) as client:
+        ctx = await build_context(client, args)
+        print(f"{'scenario':<28} {'req/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'queries':>7} "
+              f"{'cpu ms':>8} {'errors':>6}")
+
+        for scenario in SCENARIOS:
+            if selected and scenario.name not in selected:
+                continue
+            results[scenario.name] = await run_scenario(
+                client, ctx, scenario, args.requests, args.concurrency, args.warmup
+            )
+            print_row(scenario.name, results[scenario.name])
+
+        scaling_names = {f"tasks_list_comments_{level}" for level in levels}
+        if levels and (not selected or selected & scaling_names):
+            async with comment_fixtures(levels, tasks_per_level=20) as users:
+                for scenario in comment_scaling_scenarios(users):
+                    if selected and scenario.name not in selected:
+                        continue
+                    results[scenario.name] = await run_scenario(
+                        client, ctx, scenario, args.requests, args.concurrency, args.warmup
+                    )
+                    print_row(scenario.name, results[scenario.name])
+
+    output = args.output or RESULTS_DIR / f"{datetime.now(timezone.utc):%Y%m%dT%H%M%SZ}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps({
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "git_revision": git_revision(),
+        "config": {"requests": args.requests, "concurrency": args.concurrency, "warmup": args.warmup},
+        "results": results,
+    }, indent=2))
+    print(f"\nNatijalar: {output}")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())["results"]
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print("\nRegressiyalar:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(parse_args())))
@@ -0,0 +1,140 @@
+import itertools
+import random
+
+import httpx
+from sqlalchemy import select
+
+from app.config import settings
+from app.database.session import async_session
+from app.models.task import Task
+from app.utils.enums import TaskStatus
+from benchmarks.harness import Scenario
+
+SEARCH_TERMS = ["login", "dashboard", "qidiruv", "eksport", "docker", "kommentlar", "token", "admin"]
+
+
+async def _login(client: httpx.AsyncClient, email: str, password: str) -> dict:
+    response = await client.post("/auth/login", json={"email": email, "password": password})
+    response.raise_for_status()
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+async def build_context(client: httpx.AsyncClient, args) -> dict:
+    admin = await _login(client, args.admin_email, args.admin_password)
+    developer = await _login(client, args.dev_email, args.dev_password)
+
+    response = await client.get("/tasks/", headers=admin, params={"per_page": 100, "include_total": False})
+    response.raise_for_status()
+    task_ids = [task["id"] for task in response.json()["items"]]
+    if not task_ids:
+        raise SystemExit("Bazada task yo'q — avval seed.py ni ishga tushiring")
+
+    async with async_session() as db:
+        result = await db.execute(select(Task.id).order_by(Task.comments_count.desc()).limit(1))
+        busiest_task = str(result.scalar_one())
+
+    rng = random.Random(0)
+    return {
+        "args": args,
+        "admin": admin,
+        "developer": developer,
+        "task_ids": task_ids,
+        "busiest_task": busiest_task,
+        "rng": rng,
+        "search_terms": itertools.cycle(SEARCH_TERMS),
+        "statuses": itertools.cycle([s.value for s in TaskStatus]),
+    }
+
+
+def _list(**params):
+    async def request(client, ctx):
+        return await client.get("/tasks/", headers=ctx["admin"], params=params)
+    return request
+
+
+async def _list_developer(client, ctx):
+    return await client.get("/tasks/", headers=ctx["developer"])
+
+
+async def _list_search(client, ctx):
+    return await client.get("/tasks/", headers=ctx["admin"], params={"search": next(ctx["search_terms"])})
+
+
+async def _detail(client, ctx):
+    return await client.get(f"/tasks/{ctx['rng'].choice(ctx['task_ids'])}", headers=ctx["admin"])
+
+
+async def _status(client, ctx):
+    task_id = ctx["rng"].choice(ctx["task_ids"])
+    return await client.patch(f"/tasks/{task_id}/status", headers=ctx["admin"],
+                              json={"status": next(ctx["statuses"])})
+
+
+async def _comments_list(client, ctx):
+    return await client.get(f"/tasks/{ctx['busiest_task']}/comments/", headers=ctx["admin"])
+
+
+async def _comment_create(client, ctx):
+    task_id = ctx["rng"].choice(ctx["task_ids"])
+    return await client.post(f"/tasks/{task_id}/comments/", headers=ctx["admin"], json={"text": "Benchmark komment"})
+
+
+async def _stats(client, ctx):
+    return await client.get("/tasks/stats", headers=ctx["admin"])
+
+
+async def _board(client, ctx):
+    return await client.get("/tasks/board", headers=ctx["admin"])
+
+
+async def _board_by_status(client, ctx):
+    # What the board cost before /tasks/board: one list request per column
+    for status in TaskStatus:
+        response = await client.get("/tasks/", headers=ctx["admin"], params={"status": status.value})
+        response.raise_for_status()
+    return response
+
+
+async def _overdue(client, ctx):
+    return await client.get("/tasks/overdue", headers=ctx["admin"])
+
+
+async def _login_request(client, ctx):
+    args = ctx["args"]
+    return await client.post("/auth/login", json={"email": args.dev_email, "password": args.dev_password})
+
+
+SCENARIOS = [
+    Scenario("tasks_list", _list()),
+    Scenario("tasks_list_filtered", _list(status="in_progress", priority="high")),
+    Scenario("tasks_list_search", _list_search),
+    Scenario("tasks_list_developer", _list_developer),
+    Scenario("tasks_list_page_50", _list(page=50)),
+    Scenario("tasks_list_100", _list(per_page=100)),
+    Scenario("task_detail", _detail),
+    Scenario("task_status", _status),
+    Scenario("comments_list", _comments_list),
+    Scenario("comment_create", _comment_create),
+    Scenario("tasks_stats", _stats),
+    Scenario("tasks_overdue", _overdue),
+    Scenario("tasks_board", _board),
+    Scenario("tasks_board_by_status", _board_by_status),
+    Scenario("login", _login_request),
+    # More logins in flight than the pool has connections: a login holding
+    # its connection while queued for bcrypt would starve the list requests
+    Scenario(
+        "tasks_list_during_logins", _list(), background=_login_request,
+        background_concurrency=settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW + 4,
+    ),
+]
+
+
+def comment_scaling_scenarios(users: dict) -> list[Scenario]:
+    """Task list latency when every task on the page carries ``level`` comments."""
+    scenarios = []
+    for level, user_id in users.items():
+        async def list_request(client, ctx, user_id=user_id):
+            return await client.get("/tasks/", headers=ctx["admin"], params={"assigned_to": str(user_id)})
+
+        scenarios.append(Scenario(f"tasks_list_comments_{level}", list_request))
+    return scenarios
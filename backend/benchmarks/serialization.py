@@ -0,0 +1,96 @@
+"""Serialization benchmark - bitta task sahifasini JSON ga aylantirish narxi
+
+    python -m benchmarks.serialization --per-page 100 --iterations 200
+
+Bir xil sahifa uch usulda quriladi va har biri uchun jarayon CPU vaqti
+(process_time) va umumiy vaqt o'lchanadi:
+
+    orm       - ORM Task + selectinload, har bir qator uchun TaskResponse,
+                keyin response_model bo'yicha qayta validatsiya (FastAPI kabi)
+    core      - bitta JOIN li Core so'rov, qatordan TaskResponse
+    sql_json  - Postgres json_build_object, Python faqat satrlarni birlashtiradi
+"""
+import argparse
+import asyncio
+import json
+import time
+
+from pydantic import TypeAdapter
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+
+from app.database.session import async_session
+from app.models.task import Task
+from app.schemas.task import TaskListResponse, TaskResponse
+from app.services.task_service import (
+    _json_array, _row_to_response, _task_json_rows, _task_rows, tasks_table,
+)
+
+list_adapter = TypeAdapter(TaskListResponse)
+
+
+def _render(page: TaskListResponse) -> bytes:
+    # What FastAPI does with a returned model: dump, validate against
+    # response_model, serialize, json.dumps
+    validated = list_adapter.validate_python(page.model_dump())
+    return json.dumps(list_adapter.dump_python(validated, mode="json"), separators=(",", ":")).encode()
+
+
+async def orm_page(db, per_page: int) -> bytes:
+    result = await db.execute(
+        select(Task)
+        .options(selectinload(Task.assignee), selectinload(Task.creator))
+        .order_by(Task.created_at.desc(), Task.id.desc())
+        .limit(per_page)
+    )
+    items = [TaskResponse.model_validate(task) for task in result.scalars().all()]
+    return _render(TaskListResponse(items=items, per_page=per_page))
+
+
+async def core_page(db, per_page: int) -> bytes:
+    result = await db.execute(
+        _task_rows(tasks_table)
+        .order_by(tasks_table.c.created_at.desc(), tasks_table.c.id.desc())
+        .limit(per_page)
+    )
+    items = [_row_to_response(row) for row in result.all()]
+    return _render(TaskListResponse(items=items, per_page=per_page))
+
+
+async def sql_json_page(db, per_page: int) -> bytes:
+    result = await db.execute(
+        _task_json_rows(tasks_table)
+        .order_by(tasks_table.c.created_at.desc(), tasks_table.c.id.desc())
+        .limit(per_page)
+    )
+    page_info = json.dumps({"per_page": per_page}, separators=(",", ":"))
+    return ('{"items":' + _json_array(result.all()) + "," + page_info[1:]).encode()
+
+
+PATHS = {"orm": orm_page, "core": core_page, "sql_json": sql_json_page}
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Task sahifasini serializatsiya qilish narxi")
+    parser.add_argument("--per-page", type=int, default=100)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--warmup", type=int, default=10)
+    return parser.parse_args()
+
+
+async def main(args) -> None:
+    print(f"{'path':<10} {'cpu ms':>8} {'wall ms':>8} {'bytes':>8}")
+    async with async_session() as db:
+        for name, build in PATHS.items():
+            for _ in range(args.warmup):
+                await build(db, args.per_page)
+            cpu_started, wall_started = time.process_time(), time.perf_counter()
+            for _ in range(args.iterations):
+                body = await build(db, args.per_page)
+            cpu = (time.process_time() - cpu_started) * 1000 / args.iterations
+            wall = (time.perf_counter() - wall_started) * 1000 / args.iterations
+            print(f"{name:<10} {cpu:>8.2f} {wall:>8.2f} {len(body):>8}", flush=True)
+
+
+if __name__ == "__main__":
+    asyncio.run(main(parse_args()))
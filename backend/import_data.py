@@ -0,0 +1,51 @@
+"""Import script - eski trackerdan task va kommentlarni COPY orqali yuklash
+
+Misollar:
+    python import_data.py tasks tasks.csv --creator-email admin@example.com
+    python import_data.py comments comments.ndjson
+
+Tasks ustunlari: id | external_id, title, description, status, priority,
+assignee_email, creator_email, deadline, completed_at, created_at, updated_at
+Comments ustunlari: id | external_id, task_id | task_external_id, text,
+author_email, created_at
+"""
+import argparse
+import asyncio
+from pathlib import Path
+
+from app.services.import_service import ImportProgress, import_file
+
+
+def report(progress: ImportProgress) -> None:
+    print(
+        f"  {progress.processed} qator: {progress.inserted} qo'shildi, "
+        f"{progress.skipped} mavjud, {progress.rejected} rad etildi "
+        f"({progress.rate:.0f} qator/s)",
+        flush=True,
+    )
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Task va kommentlarni CSV/NDJSON fayldan import qilish")
+    parser.add_argument("kind", choices=["tasks", "comments"])
+    parser.add_argument("path", type=Path)
+    parser.add_argument("--creator-email", help="creator_email bo'lmagan tasklar uchun muallif")
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    args = parser.parse_args()
+
+    print(f"Import boshlandi: {args.kind} <- {args.path}")
+    progress = await import_file(
+        args.kind,
+        args.path,
+        chunk_size=args.chunk_size,
+        default_creator=args.creator_email,
+        on_progress=report,
+    )
+    print("\n=== IMPORT TUGADI ===")
+    print(f"Qo'shildi: {progress.inserted}, mavjud: {progress.skipped}, rad etildi: {progress.rejected}")
+    if progress.rejected:
+        print(f"Rad etilgan qatorlar: {args.path}.rejects.ndjson")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
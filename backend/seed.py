@@ -1,295 +1,269 @@
-"""Seed script - test ma'lumotlarini bazaga qo'shish"""
+"""Seed script - test ma'lumotlarini bazaga qo'shish
+
+Kichik demo baza (standart):
+    python seed.py
+
+Benchmark uchun katta baza:
+    python seed.py --users 5000 --tasks 2000000 --comments-per-task lognormal --seed 42
+
+Sanalar --anchor kunidan (standart - bugun) orqaga hisoblanadi, ochiq
+tasklarning deadline lari uning ikki tomoniga tushadi. Bir xil --seed va
+--anchor bilan bo'sh bazada har doim bir xil ma'lumot hosil bo'ladi; qayta
+ishga tushirilsa mavjud qatorlar o'tkazib yuboriladi.
+"""
+import argparse
 import asyncio
+import math
+import random
+import time
 import uuid
-from datetime import datetime, timezone, timedelta
-from sqlalchemy import select
+from datetime import date, datetime, timezone, timedelta
+
+from sqlalchemy import select, text
+from sqlalchemy.dialects.postgresql import insert
+
+from app.config import settings
+from app.core.security import hash_password
 from app.database.session import async_session
 from app.models.user import User
-from app.models.task import Task
-from app.models.comment import Comment
-from app.core.security import hash_password
+from app.services.import_service import load_tasks_chunk, load_comments_chunk
 from app.utils.enums import UserRole, UserStatus, TaskStatus, TaskPriority
 
+DEMO_DEVELOPERS = [
+    ("Ali Valiyev", "ali@example.com"),
+    ("Vali Aliyev", "vali@example.com"),
+    ("Sardor Karimov", "sardor@example.com"),
+    ("Nodira Umarova", "nodira@example.com"),
+    ("Bekzod Toshmatov", "bekzod@example.com"),
+]
+FIRST_NAMES = ["Ali", "Vali", "Sardor", "Nodira", "Bekzod", "Jasur", "Malika", "Dilshod", "Kamola", "Aziz",
+               "Madina", "Otabek", "Zarina", "Jahongir", "Shahzod", "Gulnora", "Rustam", "Feruza", "Timur", "Lola"]
+LAST_NAMES = ["Valiyev", "Aliyev", "Karimov", "Umarova", "Toshmatov", "Ergashev", "Rahimova", "Yusupov",
+              "Saidova", "Qodirov", "Nazarova", "Mirzayev", "Sobirova", "Xolmatov", "Ismoilova"]
+
+TITLE_VERBS = ["Qo'shish", "Tuzatish", "Optimallashtirish", "Refaktor qilish", "Test yozish", "Tekshirish",
+               "Yangilash", "Hujjatlashtirish", "Migratsiya qilish", "Keshlash"]
+TITLE_OBJECTS = ["login sahifasi", "parolni tiklash", "API rate limiting", "task ro'yxati", "dashboard",
+                 "kommentlar", "email xabarnoma", "fayl yuklash", "qidiruv", "statistika endpointi",
+                 "foydalanuvchi profili", "admin panel", "CI pipeline", "Docker image", "ma'lumotlar bazasi indekslari",
+                 "JWT refresh token", "mobil versiya", "eksport", "audit log", "ruxsatlar tizimi"]
+DESCRIPTIONS = [
+    "Foydalanuvchilar shikoyat qilmoqda, tezroq hal qilish kerak.",
+    "Acceptance kriteriyalari taskning kommentlarida yozilgan.",
+    "Avval dizayn bilan kelishib olish kerak.",
+    "Production logida xato ko'p chiqyapti, sababini topish kerak.",
+    "Unit va integration testlar bilan birga topshirilsin.",
+    "Eski kodni o'chirib, yangi servisga o'tkazish kerak.",
+]
+COMMENT_TEXTS = [
+    "Boshladim, ertaga natijani ko'rsataman.",
+    "PR ochdim, review qilib bering.",
+    "Bu yerda edge case bor, tekshirib ko'ring.",
+    "Testlar o'tdi.",
+    "Deadline o'tdi, tezroq tugatish kerak!",
+    "Qo'shimcha ma'lumot kerak, kim bilan gaplashsam bo'ladi?",
+    "Review qildim, bir nechta kichik izoh qoldirdim.",
+    "Tayyor, merge qilsa bo'ladi.",
+]
+
+STATUS_WEIGHTS = {TaskStatus.NEW: 25, TaskStatus.IN_PROGRESS: 20, TaskStatus.REVIEW: 10, TaskStatus.DONE: 45}
+PRIORITY_WEIGHTS = {TaskPriority.LOW: 30, TaskPriority.MEDIUM: 40, TaskPriority.HIGH: 20, TaskPriority.URGENT: 10}
+
+DEVELOPER_PASSWORD = "Developer1"
+ADMIN_PASSWORD = "Admin1234"
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Sintetik test ma'lumotlarini yaratish")
+    parser.add_argument("--users", type=int, default=5, help="approved developerlar soni")
+    parser.add_argument("--tasks", type=int, default=15)
+    parser.add_argument("--comments-per-task", default="lognormal",
+                        help="'lognormal' yoki har bir task uchun aniq son")
+    parser.add_argument("--comments-mean", type=float, default=2.0, help="lognormal taqsimot o'rtachasi")
+    parser.add_argument("--days", type=int, default=365, help="tasklar shu necha kun ichida yaratilgan")
+    parser.add_argument("--anchor", type=date.fromisoformat, default=datetime.now(timezone.utc).date(),
+                        help="sanalar shu kundan hisoblanadi (YYYY-MM-DD, standart - bugun)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--chunk-size", type=int, default=10000)
+    parser.add_argument("--admin-email", default=settings.INITIAL_ADMIN_EMAIL or "admin@example.com")
+    return parser.parse_args()
+
+
+def comment_counter(args, rng: random.Random):
+    if args.comments_per_task != "lognormal":
+        count = int(args.comments_per_task)
+        return lambda: count
+    # Most tasks get a few comments, a small tail gets dozens
+    sigma = 1.0
+    mu = math.log(max(args.comments_mean, 0.01)) - sigma ** 2 / 2
+    return lambda: int(rng.lognormvariate(mu, sigma))
+
+
+def random_uuid(rng: random.Random) -> uuid.UUID:
+    return uuid.UUID(int=rng.getrandbits(128), version=4)
+
+
+async def seed_users(args, rng: random.Random) -> tuple[uuid.UUID, list[uuid.UUID]]:
+    # bcrypt is slow on purpose, so every generated user shares one hash
+    developer_hash = hash_password(DEVELOPER_PASSWORD)
+    now = anchor_time(args)
 
-async def seed():
     async with async_session() as db:
-        # === USERS ===
-        # Admin allaqachon bor (jaxjax9114@gmail.com), uni topamiz
-        result = await db.execute(select(User).where(User.role == UserRole.ADMIN))
-        admin = result.scalar_one_or_none()
-
-        if not admin:
-            print("Admin topilmadi! Avval signup qiling.")
-            return
-
-        print(f"Admin topildi: {admin.full_name} ({admin.email})")
-
-        # Approved developers
-        developers_data = [
-            {"full_name": "Ali Valiyev", "email": "ali@example.com"},
-            {"full_name": "Vali Aliyev", "email": "vali@example.com"},
-            {"full_name": "Sardor Karimov", "email": "sardor@example.com"},
-            {"full_name": "Nodira Umarova", "email": "nodira@example.com"},
-            {"full_name": "Bekzod Toshmatov", "email": "bekzod@example.com"},
+        result = await db.execute(select(User.id).where(User.email == args.admin_email))
+        admin_id = result.scalar_one_or_none()
+        if admin_id is None:
+            admin_id = uuid.uuid5(uuid.NAMESPACE_URL, args.admin_email)
+            db.add(User(
+                id=admin_id,
+                full_name="Admin",
+                email=args.admin_email,
+                hashed_password=hash_password(ADMIN_PASSWORD),
+                role=UserRole.ADMIN,
+                status=UserStatus.APPROVED,
+            ))
+            await db.commit()
+            print(f"Admin yaratildi: {args.admin_email} / {ADMIN_PASSWORD}")
+        else:
+            print("Admin topildi")
+
+        rows = []
+        for i in range(args.users):
+            if i < len(DEMO_DEVELOPERS):
+                full_name, email = DEMO_DEVELOPERS[i]
+            else:
+                full_name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+                email = f"dev{i:06d}@example.com"
+            rows.append({"full_name": full_name, "email": email, "status": UserStatus.APPROVED,
+                         "approved_by": admin_id})
+        rows += [
+            {"full_name": "Jasur Ergashev", "email": "jasur@example.com", "status": UserStatus.PENDING},
+            {"full_name": "Malika Rahimova", "email": "malika@example.com", "status": UserStatus.PENDING},
+            {"full_name": "Rad Etilgan User", "email": "rejected@example.com", "status": UserStatus.REJECTED},
         ]
+        for row in rows:
+            row.update(id=uuid.uuid5(uuid.NAMESPACE_URL, row["email"]), hashed_password=developer_hash,
+                       role=UserRole.DEVELOPER, created_at=now - timedelta(days=args.days))
+            row.setdefault("approved_by", None)
 
-        developers = []
-        for dev_data in developers_data:
-            existing = await db.execute(select(User).where(User.email == dev_data["email"]))
-            if existing.scalar_one_or_none():
-                continue
-            dev = User(
-                full_name=dev_data["full_name"],
-                email=dev_data["email"],
-                hashed_password=hash_password("Developer1"),
-                role=UserRole.DEVELOPER,
-                status=UserStatus.APPROVED,
-                approved_by=admin.id,
+        for start in range(0, len(rows), 1000):
+            await db.execute(
+                insert(User).values(rows[start:start + 1000]).on_conflict_do_nothing(index_elements=["email"])
             )
-            db.add(dev)
-            developers.append(dev)
+        await db.commit()
 
-        # Pending users
-        pending_data = [
-            {"full_name": "Jasur Ergashev", "email": "jasur@example.com"},
-            {"full_name": "Malika Rahimova", "email": "malika@example.com"},
-        ]
-        for p_data in pending_data:
-            existing = await db.execute(select(User).where(User.email == p_data["email"]))
-            if existing.scalar_one_or_none():
-                continue
-            pending_user = User(
-                full_name=p_data["full_name"],
-                email=p_data["email"],
-                hashed_password=hash_password("Pending123"),
-                role=UserRole.DEVELOPER,
-                status=UserStatus.PENDING,
+        # Only the developers generated above, in generation order; an email that
+        # already existed keeps its own id
+        emails = [row["email"] for row in rows if row["status"] == UserStatus.APPROVED]
+        ids = {}
+        for start in range(0, len(emails), 1000):
+            result = await db.execute(
+                select(User.email, User.id).where(User.email.in_(emails[start:start + 1000]))
             )
-            db.add(pending_user)
+            ids.update(result.all())
+        developers = [ids[email] for email in emails]
 
-        # Rejected user
-        existing = await db.execute(select(User).where(User.email == "rejected@example.com"))
-        if not existing.scalar_one_or_none():
-            db.add(User(
-                full_name="Rad Etilgan User",
-                email="rejected@example.com",
-                hashed_password=hash_password("Rejected1"),
-                role=UserRole.DEVELOPER,
-                status=UserStatus.REJECTED,
-            ))
+    print(f"Developerlar soni: {len(developers)}")
+    return admin_id, developers
 
-        await db.commit()
 
-        # Reload developers
-        result = await db.execute(
-            select(User).where(User.role == UserRole.DEVELOPER, User.status == UserStatus.APPROVED)
-        )
-        developers = result.scalars().all()
-        print(f"Developerlar soni: {len(developers)}")
-
-        now = datetime.now(timezone.utc)
-
-        # === TASKS ===
-        tasks_data = [
-            # NEW tasks
-            {
-                "title": "Login sahifasiga 'Parolni unutdim' qo'shish",
-                "description": "Foydalanuvchi parolni tiklash uchun email orqali link olishi kerak. Reset token 1 soat amal qilsin.",
-                "status": TaskStatus.NEW,
-                "priority": TaskPriority.MEDIUM,
-                "assigned_to": developers[0].id,
-                "deadline": now + timedelta(days=7),
-            },
-            {
-                "title": "API rate limiting qo'shish",
-                "description": "Har bir IP uchun daqiqasiga 100 ta so'rov cheklovi o'rnatish kerak. Redis yoki in-memory cache ishlatilsin.",
-                "status": TaskStatus.NEW,
-                "priority": TaskPriority.HIGH,
-                "assigned_to": developers[1].id,
-                "deadline": now + timedelta(days=5),
-            },
-            {
-                "title": "Foydalanuvchi profil sahifasi",
-                "description": "User o'z ismini va parolini o'zgartira olsin. Avatar yuklash keyingi bosqichda.",
-                "status": TaskStatus.NEW,
-                "priority": TaskPriority.LOW,
-                "assigned_to": developers[2].id,
-                "deadline": now + timedelta(days=14),
-            },
-            {
-                "title": "Dark mode qo'shish",
-                "description": "Tailwind dark mode yoqilsin, toggle button header ga qo'yilsin.",
-                "status": TaskStatus.NEW,
-                "priority": TaskPriority.LOW,
-                "assigned_to": None,
-                "deadline": None,
-            },
-
-            # IN_PROGRESS tasks
-            {
-                "title": "Dashboard grafiklari",
-                "description": "Chart.js yoki Recharts bilan vizual statistika: pie chart (status), bar chart (developer). Real-time yangilanish shart emas.",
-                "status": TaskStatus.IN_PROGRESS,
-                "priority": TaskPriority.HIGH,
-                "assigned_to": developers[0].id,
-                "deadline": now + timedelta(days=3),
-            },
-            {
-                "title": "Task filtrlash va qidiruv optimizatsiyasi",
-                "description": "Debounce qo'shish (300ms), URL query params bilan sync qilish, filter holatini saqlash.",
-                "status": TaskStatus.IN_PROGRESS,
-                "priority": TaskPriority.MEDIUM,
-                "assigned_to": developers[3].id,
-                "deadline": now + timedelta(days=4),
-            },
-            {
-                "title": "Email bildirishnomalar tizimi",
-                "description": "Task assign bo'lganda, status o'zgarganda developer ga email yuborish. SMTP sozlamalari .env dan olinsin.",
-                "status": TaskStatus.IN_PROGRESS,
-                "priority": TaskPriority.URGENT,
-                "assigned_to": developers[1].id,
-                "deadline": now + timedelta(days=2),
-            },
-
-            # REVIEW tasks
-            {
-                "title": "Unit testlar yozish - Auth service",
-                "description": "pytest + httpx bilan signup, login, refresh endpointlari uchun testlar. Kamida 90% coverage.",
-                "status": TaskStatus.REVIEW,
-                "priority": TaskPriority.HIGH,
-                "assigned_to": developers[2].id,
-                "deadline": now + timedelta(days=1),
-            },
-            {
-                "title": "Responsive dizayn tuzatishlari",
-                "description": "Mobile (320px-768px) da sidebar, task card, forma elementlari to'g'ri ko'rinishi kerak. Safari va Chrome da test qilingan.",
-                "status": TaskStatus.REVIEW,
-                "priority": TaskPriority.MEDIUM,
-                "assigned_to": developers[4].id,
-                "deadline": now + timedelta(days=2),
-            },
-
-            # DONE tasks
-            {
-                "title": "JWT autentifikatsiya tizimi",
-                "description": "Access + Refresh token mexanizmi. bcrypt password hashing. Token muddati: access 30 min, refresh 7 kun.",
-                "status": TaskStatus.DONE,
-                "priority": TaskPriority.URGENT,
-                "assigned_to": developers[0].id,
-                "deadline": now - timedelta(days=2),
-                "completed_at": now - timedelta(days=3),
-            },
-            {
-                "title": "User CRUD API",
-                "description": "Admin foydalanuvchilarni ko'rish, tasdiqlash, rad etish, rol o'zgartirish endpointlari.",
-                "status": TaskStatus.DONE,
-                "priority": TaskPriority.HIGH,
-                "assigned_to": developers[1].id,
-                "deadline": now - timedelta(days=5),
-                "completed_at": now - timedelta(days=6),
-            },
-            {
-                "title": "Docker Compose konfiguratsiya",
-                "description": "PostgreSQL, Backend, Frontend uchun docker-compose.yml. Health check, volume mount, env file sozlamalari.",
-                "status": TaskStatus.DONE,
-                "priority": TaskPriority.MEDIUM,
-                "assigned_to": developers[3].id,
-                "deadline": now - timedelta(days=10),
-                "completed_at": now - timedelta(days=11),
-            },
-            {
-                "title": "Alembic migration tizimi",
-                "description": "Async engine bilan Alembic sozlash, initial migration yaratish.",
-                "status": TaskStatus.DONE,
-                "priority": TaskPriority.MEDIUM,
-                "assigned_to": developers[4].id,
-                "deadline": now - timedelta(days=12),
-                "completed_at": now - timedelta(days=13),
-            },
-
-            # OVERDUE tasks (deadline o'tgan, lekin done emas)
-            {
-                "title": "Xavfsizlik audit - SQL injection tekshiruv",
-                "description": "Barcha endpointlarni SQL injection ga tekshirish. Parameterized query ishlatilganini tasdiqlash.",
-                "status": TaskStatus.IN_PROGRESS,
-                "priority": TaskPriority.URGENT,
-                "assigned_to": developers[2].id,
-                "deadline": now - timedelta(days=1),
-            },
-            {
-                "title": "CI/CD pipeline sozlash",
-                "description": "GitHub Actions: lint, test, build, deploy. Staging va production muhitlari uchun.",
-                "status": TaskStatus.NEW,
-                "priority": TaskPriority.HIGH,
-                "assigned_to": developers[4].id,
-                "deadline": now - timedelta(days=3),
-            },
-        ]
+def generate_task(rng: random.Random, number: int, admin_id, developers, now: datetime, days: int) -> tuple:
+    created_at = now - timedelta(seconds=rng.uniform(0, days * 86400))
+    status = rng.choices(list(STATUS_WEIGHTS), weights=list(STATUS_WEIGHTS.values()))[0]
+    priority = rng.choices(list(PRIORITY_WEIGHTS), weights=list(PRIORITY_WEIGHTS.values()))[0]
+    assigned_to = rng.choice(developers) if developers and rng.random() < 0.9 else None
 
-        created_tasks = []
-        for t_data in tasks_data:
-            task = Task(
-                title=t_data["title"],
-                description=t_data["description"],
-                status=t_data["status"],
-                priority=t_data["priority"],
-                assigned_to=t_data.get("assigned_to"),
-                created_by=admin.id,
-                deadline=t_data.get("deadline"),
-                completed_at=t_data.get("completed_at"),
-            )
-            db.add(task)
-            created_tasks.append(task)
+    # Urgent work gets short deadlines; about a fifth of tasks have none.
+    # Open tasks are due around the anchor, about a third of them overdue,
+    # so the overdue queries see a realistic share rather than all of them
+    deadline = None
+    if rng.random() < 0.8:
+        horizon = {TaskPriority.URGENT: 3, TaskPriority.HIGH: 7, TaskPriority.MEDIUM: 14, TaskPriority.LOW: 30}
+        deadline = created_at + timedelta(days=rng.uniform(0.5, horizon[priority]))
+        if status != TaskStatus.DONE:
+            due = now + timedelta(days=rng.uniform(-horizon[priority], 2 * horizon[priority]))
+            deadline = max(due, created_at + timedelta(hours=12))
 
-        await db.commit()
+    completed_at = None
+    updated_at = created_at + timedelta(seconds=rng.uniform(0, 3 * 86400))
+    if status == TaskStatus.DONE:
+        completed_at = created_at + timedelta(days=rng.expovariate(1 / 5))
+        updated_at = completed_at
+    updated_at = min(updated_at, now)
+    if completed_at:
+        completed_at = min(completed_at, now)
 
-        # Refresh tasks to get IDs
-        for t in created_tasks:
-            await db.refresh(t)
+    title = f"{rng.choice(TITLE_OBJECTS).capitalize()}: {rng.choice(TITLE_VERBS).lower()} #{number}"
+    description = rng.choice(DESCRIPTIONS) if rng.random() < 0.7 else None
+    return (
+        random_uuid(rng), title, description, status.value, priority.value, assigned_to, admin_id,
+        deadline, completed_at, 0, created_at, updated_at,
+    )
 
-        print(f"Tasklar yaratildi: {len(created_tasks)}")
 
-        # === COMMENTS ===
-        comments_data = [
-            (created_tasks[4], developers[0], "Recharts tanlandi, boshlandi. Pie chart tayyor."),
-            (created_tasks[4], admin, "Bar chart ham kerak, developer bo'yicha progress ko'rsatsin."),
-            (created_tasks[4], developers[0], "Tushunarli, bugun qo'shaman."),
+def generate_comments(rng: random.Random, task: tuple, count: int, admin_id, now: datetime) -> list[tuple]:
+    task_id, assigned_to, created_at = task[0], task[5], task[10]
+    comments = []
+    for _ in range(count):
+        author = assigned_to if assigned_to and rng.random() < 0.7 else admin_id
+        at = created_at + (now - created_at) * rng.random()
+        comments.append((random_uuid(rng), rng.choice(COMMENT_TEXTS), task_id, author, at, at))
+    return comments
 
-            (created_tasks[6], developers[1], "SMTP sozlamalari qo'shildi, test emaillar yuborilmoqda."),
-            (created_tasks[6], admin, "Gmail SMTP ishlatamizmi yoki SendGrid?"),
-            (created_tasks[6], developers[1], "Hozircha Gmail, keyinroq SendGrid ga o'tamiz."),
 
-            (created_tasks[7], developers[2], "Barcha testlar yashil, PR tayyor."),
-            (created_tasks[7], admin, "Coverage 92% ekan, zo'r. Edge case lar ham bormi?"),
+def anchor_time(args) -> datetime:
+    # Midnight of the anchor day: the same --anchor gives the same rows
+    return datetime.combine(args.anchor, datetime.min.time(), tzinfo=timezone.utc)
 
-            (created_tasks[8], developers[4], "Safari da flexbox bilan muammo bor edi, tuzatdim."),
 
-            (created_tasks[13], developers[2], "2 ta endpoint da raw SQL bor edi, parameterized qildim."),
-            (created_tasks[13], admin, "Deadline o'tdi, tezroq tugatish kerak!"),
+async def seed_tasks(args, rng: random.Random, admin_id, developers) -> tuple[int, int]:
+    now = anchor_time(args)
+    comments_for = comment_counter(args, rng)
+    tasks_total = comments_total = 0
+    started = time.monotonic()
+
+    for start in range(0, args.tasks, args.chunk_size):
+        tasks = [
+            generate_task(rng, number, admin_id, developers, now, args.days)
+            for number in range(start + 1, min(start + args.chunk_size, args.tasks) + 1)
         ]
+        comments = []
+        for task in tasks:
+            comments += generate_comments(rng, task, comments_for(), admin_id, now)
 
-        for task, author, text in comments_data:
-            comment = Comment(
-                text=text,
-                task_id=task.id,
-                author_id=author.id,
-            )
-            db.add(comment)
+        async with async_session() as db:
+            inserted, _ = await load_tasks_chunk(db, tasks, stamp_updated_at=False)
+            tasks_total += inserted
+            for offset in range(0, len(comments), args.chunk_size):
+                inserted, _ = await load_comments_chunk(db, comments[offset:offset + args.chunk_size], stamp_updated_at=False)
+                comments_total += inserted
+            await db.commit()
 
+        elapsed = time.monotonic() - started
+        done = start + len(tasks)
+        print(f"  {done}/{args.tasks} task ({done / elapsed:.0f} task/s), kommentlar: {comments_total}", flush=True)
+
+    return tasks_total, comments_total
+
+
+async def seed(args):
+    rng = random.Random(args.seed)
+    admin_id, developers = await seed_users(args, rng)
+    tasks_total, comments_total = await seed_tasks(args, rng, admin_id, developers)
+    async with async_session() as db:
+        # Fresh bulk loads have no planner statistics until autovacuum catches up
+        await db.execute(text("ANALYZE users, tasks, comments"))
         await db.commit()
-        print(f"Kommentlar yaratildi: {len(comments_data)}")
 
-        print("\n=== SEED TUGADI ===")
-        print(f"Userlar: 1 admin + {len(developers)} developer + 2 pending + 1 rejected")
-        print(f"Tasklar: {len(created_tasks)} ta (NEW: 4, IN_PROGRESS: 3, REVIEW: 2, DONE: 4, OVERDUE: 2)")
-        print(f"Kommentlar: {len(comments_data)} ta")
-        print("\nLogin ma'lumotlari:")
-        print("  Developerlar: ali@example.com / Developer1")
-        print("                vali@example.com / Developer1")
-        print("                sardor@example.com / Developer1")
-        print("                nodira@example.com / Developer1")
-        print("                bekzod@example.com / Developer1")
+    print("\n=== SEED TUGADI ===")
+    print(f"Anchor: {args.anchor} (xuddi shu ma'lumot uchun --anchor {args.anchor})")
+    print(f"Userlar: 1 admin + {len(developers)} developer + 2 pending + 1 rejected")
+    print(f"Tasklar: {tasks_total} ta yangi")
+    print(f"Kommentlar: {comments_total} ta yangi")
+    print("\nLogin ma'lumotlari:")
+    print(f"  Developerlar: ali@example.com / {DEVELOPER_PASSWORD}")
+    if args.users > len(DEMO_DEVELOPERS):
+        print(f"                dev000005@example.com ... / {DEVELOPER_PASSWORD}")
 
 
 if __name__ == "__main__":
-    asyncio.run(seed())
+    asyncio.run(seed(parse_args()))
@@ -0,0 +1,32 @@
+"""PATCH /tasks/bulk reports bad items one by one instead of failing the batch."""
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def tasks(client, admin):
+    created = []
+    for i in range(3):
+        response = await client.post("/tasks/", headers=admin, json={"title": f"Bulk null {i}"})
+        assert response.status_code == 201, response.text
+        created.append(response.json())
+    yield created
+    for task in created:
+        await client.delete(f"/tasks/{task['id']}", headers=admin)
+
+
+async def test_null_for_not_null_field_is_an_item_error(client, admin, tasks):
+    response = await client.patch("/tasks/bulk", headers=admin, json={"items": [
+        {"id": tasks[0]["id"], "title": None},
+        {"id": tasks[1]["id"], "priority": None},
+        {"id": tasks[2]["id"], "title": "Renamed", "description": None},
+    ]})
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert body["succeeded"] == 1 and body["failed"] == 2
+    first, second, third = body["items"]
+    assert first["task"] is None and first["error"].startswith("title")
+    assert second["task"] is None and second["error"].startswith("priority")
+    assert third["error"] is None
+    assert third["task"]["title"] == "Renamed" and third["task"]["description"] is None
@@ -0,0 +1,90 @@
+"""The hot read paths must be able to use the indexes from migrations 004,
+006 and 007. Sequential scans are disabled while explaining, so a query that
+no index matches still shows a Seq Scan even on a small database."""
+import json
+
+import pytest
+from sqlalchemy import event, text
+
+from app.database.session import engine
+
+pytestmark = pytest.mark.anyio
+
+
+class StatementRecorder:
+    def __init__(self):
+        self.statements = []
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith(("SELECT", "WITH")):
+            self.statements.append((statement, parameters))
+
+    def __enter__(self):
+        event.listen(engine.sync_engine, "before_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(engine.sync_engine, "before_cursor_execute", self._on_execute)
+
+
+def _plan_nodes(plan: dict):
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from _plan_nodes(child)
+
+
+async def _indexes_used(client, method: str, url: str, headers: dict, **kwargs) -> set[str]:
+    """Indexes in the plans of every SELECT the request issued."""
+    with StatementRecorder() as recorder:
+        response = await client.request(method, url, headers=headers, **kwargs)
+    assert response.status_code == 200, response.text
+
+    indexes = set()
+    async with engine.connect() as conn:
+        await conn.execute(text("SET LOCAL enable_seqscan = off"))
+        for statement, parameters in recorder.statements:
+            result = await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+            plan = result.scalar()
+            if isinstance(plan, str):
+                plan = json.loads(plan)
+            indexes |= {node["Index Name"] for node in _plan_nodes(plan[0]["Plan"]) if "Index Name" in node}
+    return indexes
+
+
+async def test_default_list_uses_created_at_index(client, admin):
+    assert "ix_tasks_created_at_id" in await _indexes_used(client, "GET", "/tasks/", admin)
+
+
+async def test_keyset_page_uses_created_at_index(client, admin):
+    first = await client.get("/tasks/", headers=admin, params={"per_page": 5, "include_total": False})
+    cursor = first.json()["next_cursor"]
+    assert cursor, "seed qilingan bazada kamida 6 ta task bo'lishi kerak"
+
+    indexes = await _indexes_used(client, "GET", "/tasks/", admin, params={"per_page": 5, "cursor": cursor})
+    assert "ix_tasks_created_at_id" in indexes
+
+
+async def test_developer_scope_uses_assignee_index(client, developer):
+    assert "ix_tasks_assigned_to_created_at" in await _indexes_used(client, "GET", "/tasks/", developer)
+
+
+async def test_status_filter_uses_status_index(client, admin):
+    indexes = await _indexes_used(client, "GET", "/tasks/", admin, params={"status": "review"})
+    assert "ix_tasks_status_created_at" in indexes
+
+
+async def test_overdue_scan_uses_partial_deadline_index(client, admin):
+    assert "ix_tasks_open_deadline" in await _indexes_used(client, "GET", "/tasks/overdue", admin)
+
+
+async def test_overdue_assignee_filter_uses_partial_assignee_index(client, admin, developer_id):
+    indexes = await _indexes_used(client, "GET", "/tasks/overdue", admin, params={"assigned_to": developer_id})
+    assert "ix_tasks_open_deadline_assigned_to" in indexes
+
+
+async def test_comments_use_task_id_index(client, admin):
+    tasks = await client.get("/tasks/", headers=admin, params={"per_page": 1, "include_total": False})
+    task_id = tasks.json()["items"][0]["id"]
+
+    indexes = await _indexes_used(client, "GET", f"/tasks/{task_id}/comments/", admin)
+    assert "ix_comments_task_id_created_at" in indexes
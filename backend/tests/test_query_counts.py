@@ -0,0 +1,57 @@
+"""Each task write and its response come back in one statement; a rejected
+status change costs one extra lookup for the error."""
+import pytest
+
+from benchmarks.harness import QueryCounter
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def task(client, admin, developer, developer_id):
+    # Warm the user cache so auth lookups are not counted
+    await client.get("/auth/me", headers=admin)
+    await client.get("/auth/me", headers=developer)
+    response = await client.post("/tasks/", headers=admin, json={"title": "Query count", "assigned_to": developer_id})
+    assert response.status_code == 201, response.text
+    yield response.json()
+    await client.delete(f"/tasks/{response.json()['id']}", headers=admin)
+
+
+async def _count(request) -> tuple[int, object]:
+    with QueryCounter() as queries:
+        response = await request
+    return queries.count, response
+
+
+async def test_create_task_is_one_statement(client, admin, task, developer_id):
+    count, response = await _count(
+        client.post("/tasks/", headers=admin, json={"title": "Query count 2", "assigned_to": developer_id})
+    )
+    assert response.status_code == 201
+    await client.delete(f"/tasks/{response.json()['id']}", headers=admin)
+    assert count == 1
+
+
+async def test_update_task_is_one_statement(client, admin, task):
+    count, response = await _count(client.put(f"/tasks/{task['id']}", headers=admin, json={"title": "Renamed"}))
+    assert response.status_code == 200
+    assert response.json()["title"] == "Renamed"
+    assert count == 1
+
+
+async def test_status_change_is_one_statement(client, developer, task):
+    count, response = await _count(
+        client.patch(f"/tasks/{task['id']}/status", headers=developer, json={"status": "in_progress"})
+    )
+    assert response.status_code == 200
+    assert response.json()["status"] == "in_progress"
+    assert count == 1
+
+
+async def test_rejected_status_change_is_two_statements(client, developer, task):
+    count, response = await _count(
+        client.patch(f"/tasks/{task['id']}/status", headers=developer, json={"status": "done"})
+    )
+    assert response.status_code == 400
+    assert count == 2
@@ -0,0 +1,5 @@
+import api from './axios';
+
+export const eventsApi = {
+  getTicket: () => api.post('/events/ticket'),
+};
@@ -8,5 +8,6 @@ export const tasksApi = {
   updateStatus: (id, status) => api.patch(`/tasks/${id}/status`, { status }),
   delete: (id) => api.delete(`/tasks/${id}`),
   getStats: () => api.get('/tasks/stats'),
-  getOverdue: () => api.get('/tasks/overdue'),
+  getOverdue: (params) => api.get('/tasks/overdue', { params }),
+  getOverdueByAssignee: (params) => api.get('/tasks/overdue/by-assignee', { params }),
 };
@@ -1,14 +1,85 @@
+import { useState, useEffect } from 'react';
 import { Link } from 'react-router-dom';
+import toast from 'react-hot-toast';
+import { tasksApi } from '../../api/tasks';
 import TaskStatusBadge from '../tasks/TaskStatusBadge';
 import Avatar from '../common/Avatar';
-import { formatDate } from '../../utils/helpers';
+import { TASK_PRIORITY } from '../../utils/constants';
+import { formatDate, getErrorMessage } from '../../utils/helpers';
+
+const PAGE_SIZE = 10;
+
+export default function OverdueTasks({ total }) {
+  const [tasks, setTasks] = useState([]);
+  const [nextCursor, setNextCursor] = useState(null);
+  const [groups, setGroups] = useState([]);
+  const [filters, setFilters] = useState({});
+  const [loadingMore, setLoadingMore] = useState(false);
+
+  const fetchPage = async (cursor) => {
+    const params = { limit: PAGE_SIZE, ...filters };
+    if (cursor) params.cursor = cursor;
+    const { data } = await tasksApi.getOverdue(params);
+    setTasks((prev) => (cursor ? [...prev, ...data.items] : data.items));
+    setNextCursor(data.next_cursor);
+  };
+
+  useEffect(() => {
+    fetchPage(null).catch((error) => toast.error(getErrorMessage(error)));
+  }, [filters]);
+
+  useEffect(() => {
+    tasksApi.getOverdueByAssignee({ priority: filters.priority })
+      .then(({ data }) => setGroups(data))
+      .catch((error) => toast.error(getErrorMessage(error)));
+  }, [filters.priority]);
+
+  const handleChange = (field) => (e) => {
+    setFilters({ ...filters, [field]: e.target.value || undefined });
+  };
+
+  const handleLoadMore = async () => {
+    setLoadingMore(true);
+    try {
+      await fetchPage(nextCursor);
+    } catch (error) {
+      toast.error(getErrorMessage(error));
+    } finally {
+      setLoadingMore(false);
+    }
+  };
 
-export default function OverdueTasks({ tasks }) {
   return (
     <div className="bg-white rounded-lg shadow-sm border border-red-200 p-5">
-      <h3 className="text-lg font-semibold text-red-600 mb-4">
-        Muddati o'tgan vazifalar ({tasks.length})
-      </h3>
+      <div className="flex flex-wrap items-center justify-between gap-3 mb-4">
+        <h3 className="text-lg font-semibold text-red-600">
+          Muddati o'tgan vazifalar ({total})
+        </h3>
+        <div className="flex gap-2">
+          <select
+            value={filters.assigned_to || ''}
+            onChange={handleChange('assigned_to')}
+            className="px-3 py-1.5 border border-gray-300 rounded-lg text-sm focus:outline-none focus:ring-2 focus:ring-indigo-500"
+          >
+            <option value="">Barcha developerlar</option>
+            {groups.filter((group) => group.assignee).map((group) => (
+              <option key={group.assignee.id} value={group.assignee.id}>
+                {group.assignee.full_name} ({group.count})
+              </option>
+            ))}
+          </select>
+          <select
+            value={filters.priority || ''}
+            onChange={handleChange('priority')}
+            className="px-3 py-1.5 border border-gray-300 rounded-lg text-sm focus:outline-none focus:ring-2 focus:ring-indigo-500"
+          >
+            <option value="">Barcha prioritetlar</option>
+            {Object.entries(TASK_PRIORITY).map(([key, val]) => (
+              <option key={key} value={key}>{val.label}</option>
+            ))}
+          </select>
+        </div>
+      </div>
       <div className="space-y-3">
         {tasks.map((task) => (
           <Link
@@ -30,7 +101,19 @@ export default function OverdueTasks({ tasks }) {
             )}
           </Link>
         ))}
+        {tasks.length === 0 && (
+          <p className="text-sm text-gray-500">Ma'lumot yo'q</p>
+        )}
       </div>
+      {nextCursor && (
+        <button
+          onClick={handleLoadMore}
+          disabled={loadingMore}
+          className="mt-4 w-full px-4 py-2 text-sm font-medium text-red-600 border border-red-200 rounded-lg hover:bg-red-50 disabled:opacity-50"
+        >
+          {loadingMore ? 'Yuklanmoqda...' : "Ko'proq ko'rsatish"}
+        </button>
+      )}
     </div>
   );
 }
@@ -1,6 +1,7 @@
 import { useState, useEffect } from 'react';
 import { commentsApi } from '../../api/comments';
 import { useAuth } from '../../hooks/useAuth';
+import { useTaskEvents } from '../../hooks/useTaskEvents';
 import Avatar from '../common/Avatar';
 import { formatDateTime, getErrorMessage } from '../../utils/helpers';
 import toast from 'react-hot-toast';
@@ -25,6 +26,12 @@ export default function CommentSection({ taskId }) {
     fetchComments();
   }, [taskId]);
 
+  useTaskEvents((event) => {
+    if (event.entity === 'resync' || (event.entity === 'comment' && event.task_id === taskId)) {
+      fetchComments();
+    }
+  });
+
   const handleSubmit = async (e) => {
     e.preventDefault();
     if (!text.trim()) return;
@@ -0,0 +1,52 @@
+import { useEffect, useRef } from 'react';
+import { API_URL } from '../api/axios';
+import { eventsApi } from '../api/events';
+
+const RECONNECT_DELAY = 5000;
+
+// Subscribes to server-sent task/comment change events. EventSource cannot
+// send headers, so every connect first fetches a short-lived stream ticket
+// (the access token never goes in the URL); on error it reconnects with a
+// fresh ticket.
+export function useTaskEvents(onEvent) {
+  const handlerRef = useRef(onEvent);
+  handlerRef.current = onEvent;
+
+  useEffect(() => {
+    let source;
+    let retryTimer;
+    let closed = false;
+
+    const retry = () => {
+      retryTimer = setTimeout(connect, RECONNECT_DELAY);
+    };
+
+    const connect = async () => {
+      if (closed || !localStorage.getItem('access_token')) return;
+
+      let ticket;
+      try {
+        ({ data: { ticket } } = await eventsApi.getTicket());
+      } catch {
+        retry();
+        return;
+      }
+      if (closed) return;
+
+      source = new EventSource(`${API_URL}/events/?ticket=${encodeURIComponent(ticket)}`);
+      const handle = (e) => handlerRef.current(JSON.parse(e.data));
+      ['task', 'comment', 'resync'].forEach((type) => source.addEventListener(type, handle));
+      source.onerror = () => {
+        source.close();
+        retry();
+      };
+    };
+
+    connect();
+    return () => {
+      closed = true;
+      clearTimeout(retryTimer);
+      source?.close();
+    };
+  }, []);
+}
@@ -10,18 +10,13 @@ import toast from 'react-hot-toast';
 
 export default function DashboardPage() {
   const [stats, setStats] = useState(null);
-  const [overdueTasks, setOverdueTasks] = useState([]);
   const [loading, setLoading] = useState(true);
 
   useEffect(() => {
     const fetchData = async () => {
       try {
-        const [statsRes, overdueRes] = await Promise.all([
-          tasksApi.getStats(),
-          tasksApi.getOverdue(),
-        ]);
-        setStats(statsRes.data);
-        setOverdueTasks(overdueRes.data);
+        const { data } = await tasksApi.getStats();
+        setStats(data);
       } catch (error) {
         toast.error(getErrorMessage(error));
       } finally {
@@ -46,9 +41,9 @@ export default function DashboardPage() {
             <TasksByDeveloper stats={stats} />
           </div>
 
-          {overdueTasks.length > 0 && (
+          {stats.overdue_count > 0 && (
             <div className="mt-6">
-              <OverdueTasks tasks={overdueTasks} />
+              <OverdueTasks total={stats.overdue_count} />
             </div>
           )}
         </>
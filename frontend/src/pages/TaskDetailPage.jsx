@@ -1,6 +1,7 @@
 import { useState, useEffect } from 'react';
 import { useParams, useNavigate } from 'react-router-dom';
 import { useAuth } from '../hooks/useAuth';
+import { useTaskEvents } from '../hooks/useTaskEvents';
 import { tasksApi } from '../api/tasks';
 import { usersApi } from '../api/users';
 import TaskStatusBadge from '../components/tasks/TaskStatusBadge';
@@ -54,6 +55,18 @@ export default function TaskDetailPage() {
     fetchDevelopers();
   }, [id]);
 
+  useTaskEvents((event) => {
+    if (event.entity === 'resync') {
+      fetchTask();
+    } else if (event.entity === 'task' && event.id === id) {
+      if (event.op === 'delete') {
+        navigate('/tasks');
+      } else {
+        fetchTask();
+      }
+    }
+  });
+
   const handleStatusChange = async (newStatus) => {
     try {
       const { data } = await tasksApi.updateStatus(id, newStatus);
@@ -1,5 +1,6 @@
 import { useState, useEffect } from 'react';
 import { useAuth } from '../hooks/useAuth';
+import { useTaskEvents } from '../hooks/useTaskEvents';
 import { tasksApi } from '../api/tasks';
 import { usersApi } from '../api/users';
 import TaskCard from '../components/tasks/TaskCard';
@@ -57,6 +58,31 @@ export default function TasksPage() {
     fetchTasks();
   }, [filters]);
 
+  const refreshTask = async (taskId) => {
+    try {
+      const { data } = await tasksApi.getById(taskId);
+      setTasks((prev) => prev.map((t) => (t.id === taskId ? data : t)));
+    } catch (error) {
+      setTasks((prev) => prev.filter((t) => t.id !== taskId));
+    }
+  };
+
+  // Patch the visible page in place instead of reloading the whole list
+  useTaskEvents((event) => {
+    if (event.entity === 'resync' || (event.entity === 'task' && event.op === 'insert')) {
+      fetchTasks();
+      return;
+    }
+    if (event.entity !== 'task' || !tasks.some((t) => t.id === event.id)) return;
+
+    const lostAccess = !isAdmin && event.assigned_to !== user.id;
+    if (event.op === 'delete' || lostAccess) {
+      setTasks((prev) => prev.filter((t) => t.id !== event.id));
+    } else {
+      refreshTask(event.id);
+    }
+  });
+
   const handleCreateTask = async (data) => {
     try {
       await tasksApi.create(data);